@@ -38,11 +38,13 @@ type usecases interface {
 type server struct {
 	pb.UnimplementedEchoAPIServer
 
-	usecases usecases
+	usecases  usecases
+	validator protovalidate.Validator
 }
 
 func (s *server) HelloWorld(ctx context.Context, req *pb.EchoRequest) (*pb.EchoResponse, error) {
-	if err := protovalidate.Validate(req); err != nil {
+	// используем валидатор, созданный при старте, чтобы не искать правила для сообщения на каждый запрос
+	if err := s.validator.Validate(req); err != nil {
 		return nil, status.Error(codes.InvalidArgument, err.Error())
 	} else {
 		log.Printf("Validation OK")
@@ -122,8 +124,10 @@ func main() {
 		log.Fatal(err)
 	}
 
-	// создание валидатора
-	validator, err := protovalidate.New()
+	// создание валидатора, правила для запросов компилируются сразу, а не на первом вызове
+	validator, err := protovalidate.New(
+		protovalidate.WithMessages(&pb.EchoRequest{}, &pb.CreateOrdersRequest{}),
+	)
 	if err != nil {
 		log.Fatal(err)
 	}
@@ -153,7 +157,7 @@ func main() {
 	)
 
 	// Регистрируем наш обработчик
-	pb.RegisterEchoAPIServer(s, &server{usecases: &Usecases{}})
+	pb.RegisterEchoAPIServer(s, &server{usecases: &Usecases{}, validator: validator})
 
 	// Создаем healthcheck
 	healthServer := health.NewServer()
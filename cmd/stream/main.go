@@ -54,6 +54,7 @@ func (a *API) EchoServerStream(req *stream.EchoRequest, streamServer stream.Echo
 	for i := 1; i <= 5; i++ {
 		response := &stream.EchoResponse{
 			Message: fmt.Sprintf("Echo #%d: %s", i, req.Message),
+			Payload: req.Payload,
 		}
 
 		log.Printf("EchoServerStream: Sending response #%d: %s", i, response.Message)
@@ -89,6 +90,7 @@ func (a *API) EchoBidirectionalStreamSync(streamServer stream.EchoService_EchoBi
 
 		response := &stream.EchoResponse{
 			Message: fmt.Sprintf("Sync Echo: %s", req.Message),
+			Payload: req.Payload,
 		}
 
 		if err := streamServer.Send(response); err != nil {
@@ -151,6 +153,7 @@ func (a *API) EchoBidirectionalStreamAsync(streamServer stream.EchoService_EchoB
 
 				response := &stream.EchoResponse{
 					Message: fmt.Sprintf("Async Echo (processed): %s", req.Message),
+					Payload: req.Payload,
 				}
 
 				if err := streamServer.Send(response); err != nil {
@@ -21,6 +21,7 @@ const _ = grpc.SupportPackageIsVersion7
 const (
 	EchoService_HelloWorld_FullMethodName = "/api.EchoService/HelloWorld"
 	EchoService_WithError_FullMethodName  = "/api.EchoService/WithError"
+	EchoService_Echo_FullMethodName       = "/api.EchoService/Echo"
 )
 
 // EchoServiceClient is the client API for EchoService service.
@@ -29,6 +30,7 @@ const (
 type EchoServiceClient interface {
 	HelloWorld(ctx context.Context, in *EchoRequest, opts ...grpc.CallOption) (*EchoResponse, error)
 	WithError(ctx context.Context, in *EchoRequest, opts ...grpc.CallOption) (*EchoResponse, error)
+	Echo(ctx context.Context, opts ...grpc.CallOption) (EchoService_EchoClient, error)
 }
 
 type echoServiceClient struct {
@@ -57,12 +59,44 @@ func (c *echoServiceClient) WithError(ctx context.Context, in *EchoRequest, opts
 	return out, nil
 }
 
+func (c *echoServiceClient) Echo(ctx context.Context, opts ...grpc.CallOption) (EchoService_EchoClient, error) {
+	stream, err := c.cc.NewStream(ctx, &EchoService_ServiceDesc.Streams[0], EchoService_Echo_FullMethodName, opts...)
+	if err != nil {
+		return nil, err
+	}
+	x := &echoServiceEchoClient{stream}
+	return x, nil
+}
+
+type EchoService_EchoClient interface {
+	Send(*EchoRequest) error
+	Recv() (*EchoResponse, error)
+	grpc.ClientStream
+}
+
+type echoServiceEchoClient struct {
+	grpc.ClientStream
+}
+
+func (x *echoServiceEchoClient) Send(m *EchoRequest) error {
+	return x.ClientStream.SendMsg(m)
+}
+
+func (x *echoServiceEchoClient) Recv() (*EchoResponse, error) {
+	m := new(EchoResponse)
+	if err := x.ClientStream.RecvMsg(m); err != nil {
+		return nil, err
+	}
+	return m, nil
+}
+
 // EchoServiceServer is the server API for EchoService service.
 // All implementations should embed UnimplementedEchoServiceServer
 // for forward compatibility
 type EchoServiceServer interface {
 	HelloWorld(context.Context, *EchoRequest) (*EchoResponse, error)
 	WithError(context.Context, *EchoRequest) (*EchoResponse, error)
+	Echo(EchoService_EchoServer) error
 }
 
 // UnimplementedEchoServiceServer should be embedded to have forward compatible implementations.
@@ -75,6 +109,9 @@ func (UnimplementedEchoServiceServer) HelloWorld(context.Context, *EchoRequest)
 func (UnimplementedEchoServiceServer) WithError(context.Context, *EchoRequest) (*EchoResponse, error) {
 	return nil, status.Errorf(codes.Unimplemented, "method WithError not implemented")
 }
+func (UnimplementedEchoServiceServer) Echo(EchoService_EchoServer) error {
+	return status.Errorf(codes.Unimplemented, "method Echo not implemented")
+}
 
 // UnsafeEchoServiceServer may be embedded to opt out of forward compatibility for this service.
 // Use of this interface is not recommended, as added methods to EchoServiceServer will
@@ -123,6 +160,32 @@ func _EchoService_WithError_Handler(srv interface{}, ctx context.Context, dec fu
 	return interceptor(ctx, in, info, handler)
 }
 
+func _EchoService_Echo_Handler(srv interface{}, stream grpc.ServerStream) error {
+	return srv.(EchoServiceServer).Echo(&echoServiceEchoServer{stream})
+}
+
+type EchoService_EchoServer interface {
+	Send(*EchoResponse) error
+	Recv() (*EchoRequest, error)
+	grpc.ServerStream
+}
+
+type echoServiceEchoServer struct {
+	grpc.ServerStream
+}
+
+func (x *echoServiceEchoServer) Send(m *EchoResponse) error {
+	return x.ServerStream.SendMsg(m)
+}
+
+func (x *echoServiceEchoServer) Recv() (*EchoRequest, error) {
+	m := new(EchoRequest)
+	if err := x.ServerStream.RecvMsg(m); err != nil {
+		return nil, err
+	}
+	return m, nil
+}
+
 // EchoService_ServiceDesc is the grpc.ServiceDesc for EchoService service.
 // It's only intended for direct use with grpc.RegisterService,
 // and not to be introspected or modified (even as a copy)
@@ -139,6 +202,13 @@ var EchoService_ServiceDesc = grpc.ServiceDesc{
 			Handler:    _EchoService_WithError_Handler,
 		},
 	},
-	Streams:  []grpc.StreamDesc{},
+	Streams: []grpc.StreamDesc{
+		{
+			StreamName:    "Echo",
+			Handler:       _EchoService_Echo_Handler,
+			ServerStreams: true,
+			ClientStreams: true,
+		},
+	},
 	Metadata: "api/service.proto",
 }
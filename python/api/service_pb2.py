@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x11\x61pi/service.proto\x12\x03\x61pi\"\x1d\n\x0b\x43ustomError\x12\x0e\n\x06reason\x18\x01 \x01(\t\"\x1e\n\x0b\x45\x63hoRequest\x12\x0f\n\x07message\x18\x01 \x01(\t\"\x1f\n\x0c\x45\x63hoResponse\x12\x0f\n\x07message\x18\x01 \x01(\t2v\n\x0b\x45\x63hoService\x12\x33\n\nHelloWorld\x12\x10.api.EchoRequest\x1a\x11.api.EchoResponse\"\x00\x12\x32\n\tWithError\x12\x10.api.EchoRequest\x1a\x11.api.EchoResponse\"\x00\x42*Z(github.com/easyp-tech/easyp-demo/pkg/apib\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x11\x61pi/service.proto\x12\x03\x61pi\"\x1d\n\x0b\x43ustomError\x12\x0e\n\x06reason\x18\x01 \x01(\t\"\x1e\n\x0b\x45\x63hoRequest\x12\x0f\n\x07message\x18\x01 \x01(\t\"\x1f\n\x0c\x45\x63hoResponse\x12\x0f\n\x07message\x18\x01 \x01(\t2\xa9\x01\n\x0b\x45\x63hoService\x12\x33\n\nHelloWorld\x12\x10.api.EchoRequest\x1a\x11.api.EchoResponse\"\x00\x12\x32\n\tWithError\x12\x10.api.EchoRequest\x1a\x11.api.EchoResponse\"\x00\x12\x31\n\x04\x45\x63ho\x12\x10.api.EchoRequest\x1a\x11.api.EchoResponse\"\x00(\x01\x30\x01\x42*Z(github.com/easyp-tech/easyp-demo/pkg/apib\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -38,6 +38,6 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_ECHOREQUEST']._serialized_end=87
   _globals['_ECHORESPONSE']._serialized_start=89
   _globals['_ECHORESPONSE']._serialized_end=120
-  _globals['_ECHOSERVICE']._serialized_start=122
-  _globals['_ECHOSERVICE']._serialized_end=240
+  _globals['_ECHOSERVICE']._serialized_start=123
+  _globals['_ECHOSERVICE']._serialized_end=292
 # @@protoc_insertion_point(module_scope)
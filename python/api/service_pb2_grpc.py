@@ -24,6 +24,11 @@ class EchoServiceStub(object):
                 request_serializer=api_dot_service__pb2.EchoRequest.SerializeToString,
                 response_deserializer=api_dot_service__pb2.EchoResponse.FromString,
                 )
+        self.Echo = channel.stream_stream(
+                '/api.EchoService/Echo',
+                request_serializer=api_dot_service__pb2.EchoRequest.SerializeToString,
+                response_deserializer=api_dot_service__pb2.EchoResponse.FromString,
+                )
 
 
 class EchoServiceServicer(object):
@@ -41,6 +46,12 @@ class EchoServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def Echo(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_EchoServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -54,6 +65,11 @@ def add_EchoServiceServicer_to_server(servicer, server):
                     request_deserializer=api_dot_service__pb2.EchoRequest.FromString,
                     response_serializer=api_dot_service__pb2.EchoResponse.SerializeToString,
             ),
+            'Echo': grpc.stream_stream_rpc_method_handler(
+                    servicer.Echo,
+                    request_deserializer=api_dot_service__pb2.EchoRequest.FromString,
+                    response_serializer=api_dot_service__pb2.EchoResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'api.EchoService', rpc_method_handlers)
@@ -97,3 +113,20 @@ class EchoService(object):
             api_dot_service__pb2.EchoResponse.FromString,
             options, channel_credentials,
             insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
+
+    @staticmethod
+    def Echo(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(request_iterator, target, '/api.EchoService/Echo',
+            api_dot_service__pb2.EchoRequest.SerializeToString,
+            api_dot_service__pb2.EchoResponse.FromString,
+            options, channel_credentials,
+            insecure, call_credentials, compression, wait_for_ready, timeout, metadata)
@@ -5,13 +5,17 @@ from typing import ClassVar as _ClassVar, Optional as _Optional
 DESCRIPTOR: _descriptor.FileDescriptor
 
 class EchoRequest(_message.Message):
-    __slots__ = ("message",)
+    __slots__ = ("message", "payload")
     MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    PAYLOAD_FIELD_NUMBER: _ClassVar[int]
     message: str
-    def __init__(self, message: _Optional[str] = ...) -> None: ...
+    payload: bytes
+    def __init__(self, message: _Optional[str] = ..., payload: _Optional[bytes] = ...) -> None: ...
 
 class EchoResponse(_message.Message):
-    __slots__ = ("message",)
+    __slots__ = ("message", "payload")
     MESSAGE_FIELD_NUMBER: _ClassVar[int]
+    PAYLOAD_FIELD_NUMBER: _ClassVar[int]
     message: str
-    def __init__(self, message: _Optional[str] = ...) -> None: ...
+    payload: bytes
+    def __init__(self, message: _Optional[str] = ..., payload: _Optional[bytes] = ...) -> None: ...
@@ -1,3 +1,7 @@
+import asyncio
+import itertools
+import logging
+import os
 import time
 
 import grpc
@@ -5,48 +9,129 @@ from grpc_status import rpc_status
 
 from api import service_pb2_grpc
 from api import service_pb2
+from protobuf_backend import check_protobuf_backend
 
-class LoggingClientInterceptor(grpc.UnaryUnaryClientInterceptor):
-    def intercept_unary_unary(self, continuation, client_call_details, request):
-        start_time = time.time()
+# Чистый Python-бэкенд protobuf в десятки раз медленнее C-расширения (upb/cpp),
+# поэтому падаем сразу, а не молча теряем производительность на каждом сообщении
+check_protobuf_backend()
+
+log = logging.getLogger(__name__)
+
+# Сколько запросов отправляется одним стримом Echo
+ECHO_BATCH_SIZE = 10
+
+# Статистика интерсептора пишется на уровне INFO: при LOG_LEVEL=WARNING интерсептор
+# не подключается и не стоит ничего на каждом RPC
+LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO').upper()
+
+class LoggingClientInterceptor(grpc.aio.UnaryUnaryClientInterceptor):
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        # perf_counter_ns монотонный и целочисленный, разница считается без float
+        start_time = time.perf_counter_ns()
+        # имя метода в aio приходит байтами, декодируем один раз на обе ветки
+        method = client_call_details.method.decode()
 
         try:
-            response = continuation(client_call_details, request)
-            duration = time.time() - start_time
-            print(f"[INTERCEPTOR STAT] {client_call_details.method} completed in {duration:.3f}s")
+            call = await continuation(client_call_details, request)
+            # ошибка RPC прилетает только при ожидании ответа, а не при создании вызова
+            response = await call
+            duration_us = (time.perf_counter_ns() - start_time) // 1000
+            log.info('[INTERCEPTOR STAT] %s completed in %d us', method, duration_us)
             return response
         except grpc.RpcError as e:
-            duration = time.time() - start_time
-            print(f"[INTERCEPTOR STAT] {client_call_details.method} failed after {duration:.3f}s: {e}")
+            duration_us = (time.perf_counter_ns() - start_time) // 1000
+            log.info('[INTERCEPTOR STAT] %s failed after %d us: %s', method, duration_us, e)
             raise
 
-def run():
-    # Создаем канал и клиент
-    channel = grpc.intercept_channel(
-        grpc.insecure_channel('localhost:5001'),
-        LoggingClientInterceptor(),
-    )
-    client = service_pb2_grpc.EchoServiceStub(channel)
+
+class ChannelPool:
+    """Пул независимых каналов, вызовы раскидываются по ним по кругу"""
+
+    def __init__(self, target: str = 'localhost:5001', size: int = 4):
+        # use_local_subchannel_pool не дает каналам схлопнуться в одно TCP-соединение,
+        # иначе все стримы упираются в flow-control одного HTTP/2 подключения
+        options = [
+            ('grpc.use_local_subchannel_pool', 1),
+            # держим соединение живым между вызовами, чтобы не платить за повторный handshake
+            ('grpc.keepalive_time_ms', 30000),
+            ('grpc.keepalive_permit_without_calls', 1),
+            ('grpc.http2.max_frame_size', 16384),
+            ('grpc.http2.bdp_probe', 1),
+            ('grpc.optimization_target', 'throughput'),
+        ]
+        # без статистики интерсептор не подключаем, чтобы не платить за лишний вызов на каждый RPC
+        interceptors = [LoggingClientInterceptor()] if log.isEnabledFor(logging.INFO) else None
+        self._channels = [
+            grpc.aio.insecure_channel(
+                target,
+                options=options,
+                # сжимаем сообщения, отдельный вызов может переопределить алгоритм через compression=
+                compression=grpc.Compression.Gzip,
+                interceptors=interceptors,
+            )
+            for _ in range(size)
+        ]
+        # стаб создается один раз на канал, а не на каждый вызов
+        self._stubs = [service_pb2_grpc.EchoServiceStub(channel) for channel in self._channels]
+        self._idx = itertools.count()
+
+    def next_stub(self) -> service_pb2_grpc.EchoServiceStub:
+        return self._stubs[next(self._idx) % len(self._stubs)]
+
+    async def close(self):
+        await asyncio.gather(*(channel.close() for channel in self._channels))
+
+
+async def echo_batch(stub: service_pb2_grpc.EchoServiceStub, request) -> list:
+    # Отправляем пачку запросов одним bidi-стримом: вместо отдельного вызова на каждый запрос
+    # все сообщения идут в одном HTTP/2 стриме, без лишних HEADERS-фреймов и круговых задержек
+    return [resp async for resp in stub.Echo(itertools.repeat(request, ECHO_BATCH_SIZE))]
+
+
+async def run(pool: ChannelPool):
+    request = service_pb2.EchoRequest(message="[PYTHON} Ping")
+
+    # Вызовы не зависят друг от друга: aio-вызов уходит на сервер сразу при создании,
+    # поэтому запускаем все три, а результаты забираем по очереди
+    hello_world = pool.next_stub().HelloWorld(request)
+    echo = asyncio.create_task(echo_batch(pool.next_stub(), request))
+    # второй запрос, в котором будет кастомная ошибка
+    with_error = pool.next_stub().WithError(request)
 
     try:
-        # Отправляем первый запрос
-        resp_hello_world = client.HelloWorld(service_pb2.EchoRequest(message="[PYTHON} Ping"))
-        print(f'Response hello world: {resp_hello_world}')
+        resp_hello_world = await hello_world
+        # логируем только поле, чтобы не строить текстовое представление всего сообщения
+        if log.isEnabledFor(logging.INFO):
+            log.info('Response hello world: %s', resp_hello_world.message)
+
+        responses = await echo
+        log.info('Echo stream: sent %d, received %d', ECHO_BATCH_SIZE, len(responses))
 
-        # Отправляем второй запрос, в котором будет кастомная ошибка
-        resp_with_error = client.WithError(service_pb2.EchoRequest(message="[PYTHON} Ping"))
+        resp_with_error = await with_error
     except grpc.RpcError as rpc_error:
         # полученная ошибка это ошибка сообщение от сервера gRPC, а не, например, сетевая ошибка
         status = rpc_status.from_call(rpc_error)
-        print(f'Code: {status.code}')
+        log.info('Code: %s', status.code)
 
         for detail in status.details:
             error_message = service_pb2.CustomError()
             detail.Unpack(error_message)
-            print(f'Reason: {error_message.reason}')
+            log.info('Reason: %s', error_message.reason)
 
     except Exception as e:
-        print(f"Generic error: {e}")
+        log.error('Generic error: %s', e)
+    finally:
+        echo.cancel()
+        with_error.cancel()
+
+async def main():
+    # aio-каналы привязаны к циклу событий, поэтому пул живет ровно один вызов main()
+    pool = ChannelPool('localhost:5001')
+    try:
+        await run(pool)
+    finally:
+        await pool.close()
 
 if __name__ == '__main__':
-    run()
+    logging.basicConfig(level=LOG_LEVEL)
+    asyncio.run(main())
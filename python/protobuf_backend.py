@@ -0,0 +1,23 @@
+"""
+Protobuf backend check shared by the servers and clients.
+"""
+
+from google.protobuf.internal import api_implementation
+
+
+def check_protobuf_backend():
+    """
+    Fail fast if protobuf messages would be built by the pure-Python backend.
+
+    The pure-Python backend is 10-40x slower per message than upb, so running
+    on it would silently skew every measurement.
+
+    Raises:
+        RuntimeError: If protobuf uses its pure-Python backend
+    """
+    if api_implementation.Type() == "python":
+        raise RuntimeError(
+            "protobuf uses its pure-Python backend, which is 10-40x slower per "
+            "message than upb; unset PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION or "
+            "install a protobuf wheel for this platform"
+        )
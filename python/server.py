@@ -1,68 +1,218 @@
-from concurrent import futures
+import asyncio
+import logging
+import logging.handlers
+import multiprocessing
+import os
+import queue
+import signal
 import time
 
 import grpc
-from grpc_status import rpc_status
 from google.protobuf import any_pb2
+from google.rpc import status_pb2
 
 from api import service_pb2_grpc
 from api import service_pb2
+from protobuf_backend import check_protobuf_backend
 
-class InterceptorStat(grpc.ServerInterceptor):
-    def intercept_service(self, continuation, handler_call_details: grpc.HandlerCallDetails) -> grpc.RpcMethodHandler:
+try:
+    # libuv-цикл дешевле стандартного asyncio на каждое событие ввода-вывода
+    import uvloop
+except ImportError:  # uvloop нет под Windows, работаем на стандартном цикле
+    uvloop = None
+
+# Чистый Python-бэкенд protobuf в десятки раз медленнее C-расширения (upb/cpp),
+# поэтому падаем сразу, а не молча теряем производительность на каждом сообщении
+check_protobuf_backend()
+
+log = logging.getLogger(__name__)
+
+
+class InterceptorStat(grpc.aio.ServerInterceptor):
+    async def intercept_service(self, continuation, handler_call_details: grpc.HandlerCallDetails) -> grpc.RpcMethodHandler:
         """Базовый интерсептор для униарных вызовов"""
-        method_handler = continuation(handler_call_details)
+        method_handler = await continuation(handler_call_details)
+        if method_handler is None or method_handler.unary_unary is None:
+            return method_handler
+
+        # continuation только находит обработчик, сам вызов выполняется позже,
+        # поэтому засекаем время внутри обертки над обработчиком
+        behavior = method_handler.unary_unary
+        method = handler_call_details.method
+
+        async def wrapped(request, context):
+            # perf_counter_ns монотонный и целочисленный, разница считается без float
+            start_time = time.perf_counter_ns()
+            try:
+                response = await behavior(request, context)
+            except BaseException:
+                # context.abort тоже выходит исключением, такой вызов не считаем успешным
+                log.info('[INTERCEPTOR STAT] %s failed after %d us', method, (time.perf_counter_ns() - start_time) // 1000)
+                raise
+            log.info('[INTERCEPTOR STAT] %s completed in %d us', method, (time.perf_counter_ns() - start_time) // 1000)
+            return response
+
+        return grpc.unary_unary_rpc_method_handler(
+            wrapped,
+            request_deserializer=method_handler.request_deserializer,
+            response_serializer=method_handler.response_serializer,
+        )
 
-        start_time = time.time()
-        res = method_handler
-        duration = time.time() - start_time
-        print(f"[INTERCEPTOR STAT] {handler_call_details.method} completed in {duration:.3f}s")
 
-        return res
+# Ошибка у WithError всегда одна и та же, поэтому собираем ее один раз при импорте,
+# а не упаковываем Any и статус на каждый вызов
+
+# формируем кастомную ошибку
+_ERR_DETAIL = any_pb2.Any()
+_ERR_DETAIL.Pack(service_pb2.CustomError(reason='[PYTHON] some reason'))
+
+_ERR_CODE = grpc.StatusCode.FAILED_PRECONDITION
+_ERR_MESSAGE = '[PYTHON] Custom error'
+
+# Создаем статус, дополняем его деталями: которые содержат структуру сообщения из proto файла,
+# и сразу кладем сериализованные байты в трейлер, который клиент разбирает через rpc_status.from_call.
+# Это то же самое, что делает rpc_status.to_status, только без повторной сборки на каждый вызов
+_ERR_TRAILERS = (
+    ('grpc-status-details-bin', status_pb2.Status(
+        code=_ERR_CODE.value[0],
+        message=_ERR_MESSAGE,
+        details=[_ERR_DETAIL]
+    ).SerializeToString()),
+)
+
+# Ответ HelloWorld не зависит от запроса, собираем его один раз
+_PONG = service_pb2.EchoResponse(message='pong')
+_PONG_BYTES = _PONG.SerializeToString()
+
+
+def _serialize_pong(_response) -> bytes:
+    """HelloWorld и Echo всегда отвечают _PONG, поэтому отдаем заранее сериализованные байты"""
+    return _PONG_BYTES
 
 
 class Service(service_pb2_grpc.EchoServiceServicer):
-    def HelloWorld(self, request, context):
-        print('called: ', request)
-        return service_pb2.EchoResponse(message='pong')
+    async def HelloWorld(self, request: bytes, context):
+        # тело запроса ответу не нужно, поэтому сюда приходят сырые байты,
+        # а разбираем их только для отладочного лога
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug('called: %s', service_pb2.EchoRequest.FromString(request))
+        return _PONG
 
-    def WithError(self, request, context):
-        print('Called with error')
+    async def WithError(self, request, context):
+        log.debug('Called with error')
 
-        # формируем кастомную ошибку
-        error_message = service_pb2.CustomError(reason='[PYTHON] some reason')
+        # в grpc.aio нет abort_with_status, поэтому раскладываем статус в abort вручную
+        await context.abort(_ERR_CODE, _ERR_MESSAGE, _ERR_TRAILERS)
 
-        detail = any_pb2.Any()
-        detail.Pack(error_message)
+    async def Echo(self, request_iterator, context):
+        # все запросы приходят в одном стриме, отвечаем на каждый тем же готовым ответом
+        async for _ in request_iterator:
+            yield _PONG
 
-        # Создаем статус
-        # дополняем ее деталями: которые содержат структуру сообщения из proto файла.
-        status = rpc_status.status_pb2.Status(
-            code=grpc.StatusCode.FAILED_PRECONDITION.value[0],
-            message='[PYTHON] Custom error',
-            details=[detail]
-        )
-        context.abort_with_status(rpc_status.to_status(status))
-
-def serve():
-    # https://grpc.github.io/grpc/python/grpc.html#grpc.server
-    server = grpc.server(
-        futures.ThreadPoolExecutor(max_workers=10),
-        maximum_concurrent_rpcs=10,
-        interceptors=[InterceptorStat()],
-    )
-    service_pb2_grpc.add_EchoServiceServicer_to_server(
-        Service(), server
+
+class EchoServiceHandler(grpc.GenericRpcHandler):
+    """Замена сгенерированному add_EchoServiceServicer_to_server: обработчики методов собираются
+    один раз, поиск по полному имени метода - один поиск в словаре.
+    HelloWorld получает запрос без десериализации, а ответ pong не сериализуется на каждый вызов"""
+
+    def __init__(self, servicer: Service):
+        self._method_handlers = {
+            '/api.EchoService/HelloWorld': grpc.unary_unary_rpc_method_handler(
+                servicer.HelloWorld,
+                request_deserializer=None,
+                response_serializer=_serialize_pong,
+            ),
+            '/api.EchoService/WithError': grpc.unary_unary_rpc_method_handler(
+                servicer.WithError,
+                request_deserializer=service_pb2.EchoRequest.FromString,
+                response_serializer=service_pb2.EchoResponse.SerializeToString,
+            ),
+            '/api.EchoService/Echo': grpc.stream_stream_rpc_method_handler(
+                servicer.Echo,
+                request_deserializer=service_pb2.EchoRequest.FromString,
+                response_serializer=_serialize_pong,
+            ),
+        }
+
+    def service(self, handler_call_details: grpc.HandlerCallDetails):
+        return self._method_handlers.get(handler_call_details.method)
+
+# Все вызовы обслуживаются одним event loop без пула потоков,
+# поэтому лимит одновременных RPC ограничивает только память, а не число потоков
+MAX_CONCURRENT_RPCS = (os.cpu_count() or 1) * 64
+
+# GIL не дает одному процессу занять больше одного ядра, поэтому поднимаем несколько процессов
+# на одном порту: благодаря SO_REUSEPORT ядро само распределяет между ними входящие соединения
+SERVER_PROCESSES = int(os.environ.get('SERVER_PROCESSES', os.cpu_count() or 1))
+
+# Статистика интерсептора пишется на уровне INFO: при LOG_LEVEL=WARNING интерсептор
+# не подключается и не стоит ничего на каждом RPC
+LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO').upper()
+
+# Настройки HTTP/2 под поток маленьких сообщений.
+# TCP_NODELAY gRPC выставляет на сокетах сам, отдельной опции для него нет
+SERVER_OPTIONS = [
+    ('grpc.so_reuseport', 1),
+    ('grpc.max_concurrent_streams', 1000),
+    ('grpc.http2.max_frame_size', 16384),
+    # окно flow-control подстраивается под bandwidth-delay product соединения
+    ('grpc.http2.bdp_probe', 1),
+    ('grpc.optimization_target', 'throughput'),
+]
+
+
+async def serve():
+    # https://grpc.github.io/grpc/python/grpc_asyncio.html#grpc.aio.server
+    server = grpc.aio.server(
+        maximum_concurrent_rpcs=MAX_CONCURRENT_RPCS,
+        # интерсептор добавляет лишний вызов на каждый RPC, поэтому подключаем его,
+        # только если статистика действительно пишется в лог
+        interceptors=[InterceptorStat()] if log.isEnabledFor(logging.INFO) else None,
+        options=SERVER_OPTIONS,
+        compression=grpc.Compression.Gzip,
     )
+    server.add_generic_rpc_handlers((EchoServiceHandler(Service()),))
     server.add_insecure_port('[::]:5001')
-    server.start()
-    print("Starting server...")
+    await server.start()
+    log.info("Starting server...")
+
+    try:
+        await server.wait_for_termination()
+    finally:
+        await server.stop(0)
+
+def setup_logging(level=LOG_LEVEL) -> logging.handlers.QueueListener:
+    """Запись в stdout уходит в отдельный поток, обработчики только кладут записи в очередь"""
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, logging.StreamHandler())
+    logging.basicConfig(level=level, handlers=[logging.handlers.QueueHandler(log_queue)])
+    listener.start()
+    return listener
 
+def run_worker():
+    listener = setup_logging()
     try:
-        while True:
-            time.sleep(86400)
+        (uvloop.run if uvloop is not None else asyncio.run)(serve())
     except KeyboardInterrupt:
-        server.stop(0)
+        pass
+    finally:
+        listener.stop()
 
 if __name__ == '__main__':
-    serve()
\ No newline at end of file
+    # процессы создаются до того, как в родителе появятся объекты gRPC,
+    # иначе дочерние процессы унаследуют его внутреннее состояние
+    workers = [multiprocessing.Process(target=run_worker) for _ in range(SERVER_PROCESSES)]
+    for worker in workers:
+        worker.start()
+
+    try:
+        for worker in workers:
+            worker.join()
+    except KeyboardInterrupt:
+        # Ctrl+C из терминала получают все процессы группы, а при kill -INT родителя
+        # передаем сигнал воркерам сами
+        for worker in workers:
+            if worker.is_alive():
+                os.kill(worker.pid, signal.SIGINT)
+        for worker in workers:
+            worker.join()
\ No newline at end of file
@@ -5,14 +5,16 @@ Measures latency, throughput, and resource usage for all streaming patterns.
 """
 
 import asyncio
+import collections
+import functools
+import itertools
 import logging
-import statistics
+import math
 import sys
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass, fields
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
 import argparse
 import psutil
 import os
@@ -32,19 +34,66 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+NS_PER_SECOND = 1_000_000_000
+
+# Channel options tuned for long-lived, latency sensitive streams
+CHANNEL_OPTIONS = {
+    "grpc.max_send_message_length": 50 * 1024 * 1024,
+    "grpc.max_receive_message_length": 50 * 1024 * 1024,
+    "grpc.keepalive_time_ms": 30000,
+    "grpc.keepalive_timeout_ms": 5000,
+    "grpc.keepalive_permit_without_calls": 1,
+    # Keep pinging idle streams instead of stopping after a few pings
+    "grpc.http2.max_pings_without_data": 0,
+    "grpc.http2.min_time_between_pings_ms": 10000,
+    "grpc.http2.min_ping_interval_without_data_ms": 5000,
+    "grpc.optimization_target": "throughput",
+    # Give every channel its own subchannel (and TCP connection)
+    # instead of multiplexing the whole pool over a shared one
+    "grpc.use_local_subchannel_pool": 1,
+}
+
+# Full name of the server streaming method, called without the generated stub
+SERVER_STREAM_METHOD = "/api.stream.v1.EchoService/EchoServerStream"
+
+# How long warmup waits for the channels to connect before going on anyway
+CONNECT_TIMEOUT = 5.0
+
+# Median plus a few tail percentiles reported for every test
+LATENCY_PERCENTILES = {
+    "p50_latency": 50,
+    "p95_latency": 95,
+    "p99_latency": 99,
+    "p999_latency": 99.9,
+}
+
 
 @dataclass
 class BenchmarkResult:
-    """Result of a single benchmark test."""
+    """
+    Result of a single benchmark test.
+
+    Latencies are measured per stream for client streaming, where a stream has
+    a single response, and per response message for the other patterns.
+    """
 
     test_name: str
+    num_concurrent: int
+    total_streams: int
+    message_size: int
+    messages_per_stream: int
+    target_rps: Optional[float]
     total_requests: int
     total_responses: int
     total_duration: float
+    warmup_duration: float
     avg_latency: float
     min_latency: float
     max_latency: float
+    p50_latency: float
     p95_latency: float
+    p99_latency: float
+    p999_latency: float
     requests_per_second: float
     responses_per_second: float
     cpu_usage_percent: float
@@ -53,45 +102,297 @@ class BenchmarkResult:
     success_rate: float
 
 
+def join_task_results(
+    task_results: List[Tuple[object, int, int, int]],
+) -> Tuple[list, int, int, int]:
+    """
+    Combine per-task results once all tasks have finished.
+
+    Args:
+        task_results: Per-task latency data, request, response and error counts,
+            in task order
+
+    Returns:
+        Latency data of every task in task order, and the summed counts
+    """
+    if not task_results:
+        return [], 0, 0, 0
+    latencies, requests, responses, errors = zip(*task_results)
+    return list(latencies), sum(requests), sum(responses), sum(errors)
+
+
+def send_interval(target_rps: Optional[float], num_concurrent: int) -> int:
+    """
+    Nanoseconds between two messages of one stream for a paced run.
+
+    Args:
+        target_rps: Total message rate over all streams, None for no pacing
+        num_concurrent: Number of concurrent streams sharing that rate
+
+    Returns:
+        Interval in nanoseconds, 0 when messages are sent as fast as possible
+    """
+    if not target_rps:
+        return 0
+    return int(NS_PER_SECOND * num_concurrent / target_rps)
+
+
+async def wait_until_due(stream_start: int, index: int, interval_ns: int) -> int:
+    """
+    Sleep until a message of a paced stream is due.
+
+    Latency of paced messages is measured from the returned due time rather
+    than from the moment the message actually went out, so a stall that delays
+    sending shows up as latency instead of silently shifting the schedule.
+
+    Args:
+        stream_start: perf_counter_ns() when the stream started
+        index: Index of the message in the stream
+        interval_ns: Interval between messages in nanoseconds
+
+    Returns:
+        Time the message was due, in perf_counter_ns() nanoseconds
+    """
+    due = stream_start + index * interval_ns
+    delay = due - time.perf_counter_ns()
+    if delay > 0:
+        await asyncio.sleep(delay / NS_PER_SECOND)
+    return due
+
+
+@functools.lru_cache(maxsize=None)
+def echo_request(message_size: int) -> stream_pb2.EchoRequest:
+    """
+    Build the request every benchmark sends for a given message size.
+
+    The payload is raw bytes: unlike a string field it needs no UTF-8
+    validation, and without a per-message header it is built only once
+    per size for the whole run.
+
+    Args:
+        message_size: Size of the payload in bytes
+    """
+    return stream_pb2.EchoRequest(payload=b"x" * message_size)
+
+
+def latency_stats(latencies_ns: List[int]) -> Dict[str, float]:
+    """
+    Summarize stream or message latencies.
+
+    Args:
+        latencies_ns: Latencies in nanoseconds
+
+    Returns:
+        BenchmarkResult latency fields in seconds
+    """
+    stats = dict.fromkeys(
+        ["avg_latency", "min_latency", "max_latency", *LATENCY_PERCENTILES], 0.0
+    )
+    if not latencies_ns:
+        return stats
+
+    # A single sort serves min, max and every nearest-rank percentile
+    ordered = sorted(latencies_ns)
+    count = len(ordered)
+    stats["avg_latency"] = sum(ordered) / count / NS_PER_SECOND
+    stats["min_latency"] = ordered[0] / NS_PER_SECOND
+    stats["max_latency"] = ordered[-1] / NS_PER_SECOND
+    for field, percentile in LATENCY_PERCENTILES.items():
+        rank = max(math.ceil(percentile / 100 * count), 1)
+        stats[field] = ordered[rank - 1] / NS_PER_SECOND
+    return stats
+
+
+class UsageSampler:
+    """Samples process CPU and memory usage in a background thread."""
+
+    def __init__(self, process: psutil.Process, interval: float = 0.1):
+        """
+        Initialize sampler.
+
+        Args:
+            process: Process to sample
+            interval: Seconds between samples
+        """
+        self.process = process
+        self.interval = interval
+        # Appending from one thread and reading after join needs no lock
+        self.cpu_samples = collections.deque()
+        self.memory_samples = collections.deque()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _sample(self):
+        """Record one CPU and memory sample."""
+        self.cpu_samples.append(self.process.cpu_percent(interval=None))
+        self.memory_samples.append(self.process.memory_info().rss)
+
+    def _run(self):
+        """Sampling loop, runs until stopped."""
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def start(self):
+        """Start sampling."""
+        # The first cpu_percent call only sets the baseline and always returns 0
+        self.process.cpu_percent(interval=None)
+        self._thread.start()
+
+    def stop(self) -> Tuple[float, float]:
+        """
+        Stop sampling.
+
+        Returns:
+            Average CPU usage in percent and peak memory usage in MB
+        """
+        self._stop.set()
+        self._thread.join()
+        # Short tests may finish before the first interval elapses
+        self._sample()
+        return (
+            sum(self.cpu_samples) / len(self.cpu_samples),
+            max(self.memory_samples) / 1024 / 1024,
+        )
+
+
 class StreamBenchmark:
     """Benchmark client for streaming performance testing."""
 
-    def __init__(self, server_address: str = "localhost:8080"):
-        """Initialize benchmark client."""
+    def __init__(
+        self,
+        server_address: str = "localhost:8080",
+        pool_size: Optional[int] = None,
+        channel_options: Optional[Dict[str, object]] = None,
+    ):
+        """
+        Initialize benchmark client.
+
+        Args:
+            server_address: Server address
+            pool_size: Number of channels, by default one per concurrent stream
+                up to the number of CPUs
+            channel_options: gRPC channel options overriding CHANNEL_OPTIONS
+        """
         self.server_address = server_address
-        self.channel = None
-        self.stub = None
+        self.pool_size = pool_size
+        self.channel_options = list(
+            {**CHANNEL_OPTIONS, **(channel_options or {})}.items()
+        )
+        self.channels: List[grpc.aio.Channel] = []
+        self.stubs: List[stream_pb2_grpc.EchoServiceStub] = []
+        self.raw_server_streams: List[grpc.aio.UnaryStreamMultiCallable] = []
         self.process = psutil.Process(os.getpid())
 
-    def connect(self):
-        """Establish connection to server."""
-        self.channel = grpc.insecure_channel(
-            self.server_address,
-            options=[
-                ("grpc.max_send_message_length", 50 * 1024 * 1024),
-                ("grpc.max_receive_message_length", 50 * 1024 * 1024),
-                ("grpc.keepalive_time_ms", 30000),
-                ("grpc.keepalive_timeout_ms", 5000),
-            ],
-        )
-        self.stub = stream_pb2_grpc.EchoServiceStub(self.channel)
+    def connect(self, max_concurrent: int = 1):
+        """
+        Establish a pool of connections to server.
 
-    def disconnect(self):
-        """Close connection to server."""
-        if self.channel:
-            self.channel.close()
+        Args:
+            max_concurrent: Highest number of concurrent streams that will be run
+        """
+        pool_size = self.pool_size or min(max_concurrent, os.cpu_count() or 1)
+        self.channels = [
+            grpc.aio.insecure_channel(self.server_address, options=self.channel_options)
+            for _ in range(pool_size)
+        ]
+        self.stubs = [
+            stream_pb2_grpc.EchoServiceStub(channel) for channel in self.channels
+        ]
+        # Server stream responses are only counted, so they are handed over as raw
+        # bytes instead of being parsed into an EchoResponse each
+        self.raw_server_streams = [
+            channel.unary_stream(
+                SERVER_STREAM_METHOD,
+                request_serializer=stream_pb2.EchoRequest.SerializeToString,
+            )
+            for channel in self.channels
+        ]
+
+    def _stub(self, task_id: int) -> stream_pb2_grpc.EchoServiceStub:
+        """
+        Pick the pooled stub a task should use.
+
+        A task always maps to the same channel, with a pool as large as the
+        concurrency every stream gets a connection of its own.
+        """
+        return self.stubs[task_id % len(self.stubs)]
+
+    async def disconnect(self):
+        """Close all connections to server."""
+        for channel in self.channels:
+            await channel.close()
+        self.channels = []
+        self.stubs = []
+        self.raw_server_streams = []
+
+    async def _warm_up(
+        self, run_task: Callable[[int], Awaitable], warmup_iterations: int
+    ) -> float:
+        """
+        Run throwaway streams before measuring.
+
+        Waits up to CONNECT_TIMEOUT for every pooled channel to connect, then runs
+        the given number of streams concurrently and discards their results, so
+        connection setup and first-call costs stay out of the timed window.
+
+        Args:
+            run_task: Coroutine function running one stream for a task id
+            warmup_iterations: Number of warmup streams
+
+        Returns:
+            Warmup duration in seconds
+        """
+        warmup_start = time.perf_counter_ns()
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(channel.channel_ready() for channel in self.channels)),
+                timeout=CONNECT_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            # Let the streams run anyway, their errors are counted as usual
+            logger.warning("Channels not ready after %.1fs", CONNECT_TIMEOUT)
+        await asyncio.gather(*(run_task(i) for i in range(warmup_iterations)))
+        return (time.perf_counter_ns() - warmup_start) / NS_PER_SECOND
+
+    async def _run_streams(
+        self,
+        run_task: Callable[[int], Awaitable],
+        num_concurrent: int,
+        total_streams: int,
+    ) -> list:
+        """
+        Run streams with bounded concurrency.
+
+        Args:
+            run_task: Coroutine function running one stream for a task id
+            num_concurrent: Maximum number of streams in flight
+            total_streams: Number of streams to run
+
+        Returns:
+            Results of all streams in task order
+        """
+        semaphore = asyncio.Semaphore(num_concurrent)
 
-    def _measure_system_usage(self) -> Tuple[float, float]:
-        """Measure current CPU and memory usage."""
-        cpu_percent = self.process.cpu_percent()
-        memory_mb = self.process.memory_info().rss / 1024 / 1024
-        return cpu_percent, memory_mb
+        async def bounded(task_id: int):
+            async with semaphore:
+                return await run_task(task_id)
 
-    def benchmark_client_stream(
+        return await asyncio.gather(*(bounded(i) for i in range(total_streams)))
+
+    def _start_usage_sampler(self) -> "UsageSampler":
+        """Start sampling CPU and memory usage of this process."""
+        sampler = UsageSampler(self.process)
+        sampler.start()
+        return sampler
+
+    async def benchmark_client_stream(
         self,
         num_concurrent: int = 10,
         messages_per_stream: int = 100,
         message_size: int = 1024,
+        warmup_iterations: int = 8,
+        target_rps: Optional[float] = None,
+        total_streams: Optional[int] = None,
     ) -> BenchmarkResult:
         """
         Benchmark client streaming performance.
@@ -100,96 +401,117 @@ class StreamBenchmark:
             num_concurrent: Number of concurrent streams
             messages_per_stream: Messages per stream
             message_size: Size of each message in bytes
+            warmup_iterations: Untimed streams to run before measuring
+            target_rps: Total message rate to pace the streams at, unpaced if None
+            total_streams: Streams to run in total, at most num_concurrent at a
+                time (default: num_concurrent)
         """
+        total_streams = total_streams or num_concurrent
         logger.info(
-            f"Benchmarking client streaming: {num_concurrent} concurrent, "
-            f"{messages_per_stream} msgs/stream, {message_size} bytes/msg"
+            "Benchmarking client streaming: %d concurrent, "
+            "%d msgs/stream, %d bytes/msg",
+            num_concurrent,
+            messages_per_stream,
+            message_size,
         )
 
-        latencies = []
-        errors = 0
-        total_requests = 0
-        total_responses = 0
-
-        def client_stream_task(task_id: int) -> Tuple[float, int, int, int]:
-            """Single client streaming task."""
-            nonlocal total_requests
+        # The server echoes whatever it receives, so every message can reuse
+        # one prebuilt request instead of formatting a new payload per message
+        request = echo_request(message_size)
+        interval_ns = send_interval(target_rps, num_concurrent)
+
+        async def paced_requests():
+            """Yield the request on the paced schedule."""
+            stream_start = time.perf_counter_ns()
+            for i in range(messages_per_stream):
+                await wait_until_due(stream_start, i, interval_ns)
+                yield request
+
+        def start_client_stream(task_id: int) -> Tuple[int, grpc.aio.StreamUnaryCall]:
+            """Start a client stream without waiting for its response."""
+            start_time = time.perf_counter_ns()
+            call = self._stub(task_id).EchoClientStream(
+                paced_requests()
+                if interval_ns
+                else itertools.repeat(request, messages_per_stream)
+            )
+            return start_time, call
 
-            start_time = time.time()
+        async def client_stream_task(
+            task_id: int, start_time: int, call: grpc.aio.StreamUnaryCall
+        ) -> Tuple[int, int, int, int]:
+            """Collect the response of a started client stream."""
             local_requests = 0
             local_responses = 0
             local_errors = 0
 
             try:
-
-                def generate_requests():
-                    nonlocal local_requests
-                    message_data = "x" * message_size
-                    for i in range(messages_per_stream):
-                        local_requests += 1
-                        yield stream_pb2.EchoRequest(
-                            message=f"Task-{task_id}-Msg-{i}: {message_data}"
-                        )
-
-                response = self.stub.EchoClientStream(generate_requests())
+                response = await call
+                duration = time.perf_counter_ns() - start_time
+                local_requests += messages_per_stream
                 local_responses += 1
 
             except Exception as e:
-                logger.error(f"Client stream task {task_id} error: {e}")
+                # Stop the clock first so that logging is not counted as latency
+                duration = time.perf_counter_ns() - start_time
+                logger.error("Client stream task %d error: %s", task_id, e)
                 local_errors += 1
 
-            duration = time.time() - start_time
             return duration, local_requests, local_responses, local_errors
 
-        # Measure initial system state
-        start_cpu, start_memory = self._measure_system_usage()
-        benchmark_start = time.time()
-
-        # Run concurrent client streaming tasks
-        with ThreadPoolExecutor(max_workers=num_concurrent) as executor:
-            futures = [
-                executor.submit(client_stream_task, i) for i in range(num_concurrent)
-            ]
+        warmup_duration = await self._warm_up(
+            lambda i: client_stream_task(i, *start_client_stream(i)), warmup_iterations
+        )
 
-            for future in as_completed(futures):
-                duration, requests, responses, task_errors = future.result()
-                latencies.append(duration)
-                total_requests += requests
-                total_responses += responses
-                errors += task_errors
+        # Sample system usage over the timed region
+        usage_sampler = self._start_usage_sampler()
+        benchmark_start = time.perf_counter_ns()
+
+        # Each task submits its stream before awaiting anything: grpc.aio sends
+        # the requests in the background, so every admitted stream is in flight
+        # before the first response is awaited
+        task_results = await self._run_streams(
+            lambda i: client_stream_task(i, *start_client_stream(i)),
+            num_concurrent,
+            total_streams,
+        )
 
-        benchmark_duration = time.time() - benchmark_start
+        # Stop the clock before any aggregation
+        benchmark_duration = (time.perf_counter_ns() - benchmark_start) / NS_PER_SECOND
+        cpu_usage_percent, memory_usage_mb = usage_sampler.stop()
 
-        # Measure final system state
-        end_cpu, end_memory = self._measure_system_usage()
+        latencies, total_requests, total_responses, errors = join_task_results(
+            task_results
+        )
 
         return BenchmarkResult(
             test_name="client_stream",
+            num_concurrent=num_concurrent,
+            total_streams=total_streams,
+            message_size=message_size,
+            messages_per_stream=messages_per_stream,
+            target_rps=target_rps,
             total_requests=total_requests,
             total_responses=total_responses,
             total_duration=benchmark_duration,
-            avg_latency=statistics.mean(latencies) if latencies else 0,
-            min_latency=min(latencies) if latencies else 0,
-            max_latency=max(latencies) if latencies else 0,
-            p95_latency=statistics.quantiles(latencies, n=20)[18]
-            if len(latencies) > 20
-            else max(latencies)
-            if latencies
-            else 0,
+            warmup_duration=warmup_duration,
+            **latency_stats(latencies),
             requests_per_second=total_requests / benchmark_duration,
             responses_per_second=total_responses / benchmark_duration,
-            cpu_usage_percent=(start_cpu + end_cpu) / 2,
-            memory_usage_mb=(start_memory + end_memory) / 2,
+            cpu_usage_percent=cpu_usage_percent,
+            memory_usage_mb=memory_usage_mb,
             errors=errors,
-            success_rate=(total_responses / num_concurrent * 100)
-            if num_concurrent > 0
+            success_rate=(total_responses / total_streams * 100)
+            if total_streams > 0
             else 0,
         )
 
-    def benchmark_server_stream(
+    async def benchmark_server_stream(
         self,
         num_concurrent: int = 10,
         message_size: int = 1024,
+        warmup_iterations: int = 8,
+        total_streams: Optional[int] = None,
     ) -> BenchmarkResult:
         """
         Benchmark server streaming performance.
@@ -197,93 +519,98 @@ class StreamBenchmark:
         Args:
             num_concurrent: Number of concurrent streams
             message_size: Size of request message in bytes
+            warmup_iterations: Untimed streams to run before measuring
+            total_streams: Streams to run in total, at most num_concurrent at a
+                time (default: num_concurrent)
         """
+        total_streams = total_streams or num_concurrent
         logger.info(
-            f"Benchmarking server streaming: {num_concurrent} concurrent, "
-            f"{message_size} bytes/msg"
+            "Benchmarking server streaming: %d concurrent, %d bytes/msg",
+            num_concurrent,
+            message_size,
         )
 
-        latencies = []
-        errors = 0
-        total_requests = 0
-        total_responses = 0
+        # Shared by all tasks, the payload is not part of what is being measured
+        request = echo_request(message_size)
 
-        def server_stream_task(task_id: int) -> Tuple[float, int, int, int]:
+        async def server_stream_task(
+            task_id: int,
+        ) -> Tuple[List[int], int, int, int]:
             """Single server streaming task."""
-            start_time = time.time()
+            server_stream = self.raw_server_streams[task_id % len(self.channels)]
+            start_time = time.perf_counter_ns()
+            # Each response is timed from the request that triggered the stream
+            message_latencies = []
             local_requests = 1
             local_responses = 0
             local_errors = 0
 
             try:
-                message_data = "x" * message_size
-                request = stream_pb2.EchoRequest(
-                    message=f"Task-{task_id}: {message_data}"
-                )
-
-                response_stream = self.stub.EchoServerStream(request)
+                response_stream = server_stream(request)
 
-                for response in response_stream:
+                async for response in response_stream:
+                    message_latencies.append(time.perf_counter_ns() - start_time)
                     local_responses += 1
 
             except Exception as e:
-                logger.error(f"Server stream task {task_id} error: {e}")
+                logger.error("Server stream task %d error: %s", task_id, e)
                 local_errors += 1
 
-            duration = time.time() - start_time
-            return duration, local_requests, local_responses, local_errors
+            return message_latencies, local_requests, local_responses, local_errors
 
-        # Measure initial system state
-        start_cpu, start_memory = self._measure_system_usage()
-        benchmark_start = time.time()
+        warmup_duration = await self._warm_up(server_stream_task, warmup_iterations)
 
-        # Run concurrent server streaming tasks
-        with ThreadPoolExecutor(max_workers=num_concurrent) as executor:
-            futures = [
-                executor.submit(server_stream_task, i) for i in range(num_concurrent)
-            ]
+        # Sample system usage over the timed region
+        usage_sampler = self._start_usage_sampler()
+        benchmark_start = time.perf_counter_ns()
 
-            for future in as_completed(futures):
-                duration, requests, responses, task_errors = future.result()
-                latencies.append(duration)
-                total_requests += requests
-                total_responses += responses
-                errors += task_errors
+        # Run server streaming tasks on the event loop
+        task_results = await self._run_streams(
+            server_stream_task, num_concurrent, total_streams
+        )
 
-        benchmark_duration = time.time() - benchmark_start
+        # Stop the clock before any aggregation
+        benchmark_duration = (time.perf_counter_ns() - benchmark_start) / NS_PER_SECOND
+        cpu_usage_percent, memory_usage_mb = usage_sampler.stop()
 
-        # Measure final system state
-        end_cpu, end_memory = self._measure_system_usage()
+        message_latencies, total_requests, total_responses, errors = join_task_results(
+            task_results
+        )
+        latencies = list(itertools.chain.from_iterable(message_latencies))
 
         return BenchmarkResult(
             test_name="server_stream",
+            num_concurrent=num_concurrent,
+            total_streams=total_streams,
+            message_size=message_size,
+            # The client sends a single request per server stream
+            messages_per_stream=1,
+            # The server decides when to send, there is nothing to pace
+            target_rps=None,
             total_requests=total_requests,
             total_responses=total_responses,
             total_duration=benchmark_duration,
-            avg_latency=statistics.mean(latencies) if latencies else 0,
-            min_latency=min(latencies) if latencies else 0,
-            max_latency=max(latencies) if latencies else 0,
-            p95_latency=statistics.quantiles(latencies, n=20)[18]
-            if len(latencies) > 20
-            else max(latencies)
-            if latencies
-            else 0,
+            warmup_duration=warmup_duration,
+            **latency_stats(latencies),
             requests_per_second=total_requests / benchmark_duration,
             responses_per_second=total_responses / benchmark_duration,
-            cpu_usage_percent=(start_cpu + end_cpu) / 2,
-            memory_usage_mb=(start_memory + end_memory) / 2,
+            cpu_usage_percent=cpu_usage_percent,
+            memory_usage_mb=memory_usage_mb,
             errors=errors,
-            success_rate=((num_concurrent - errors) / num_concurrent * 100)
-            if num_concurrent > 0
+            success_rate=((total_streams - errors) / total_streams * 100)
+            if total_streams > 0
             else 0,
         )
 
-    def benchmark_bidirectional_stream(
+    async def benchmark_bidirectional_stream(
         self,
         num_concurrent: int = 10,
         messages_per_stream: int = 50,
         message_size: int = 1024,
         async_mode: bool = False,
+        warmup_iterations: int = 8,
+        target_rps: Optional[float] = None,
+        total_streams: Optional[int] = None,
     ) -> BenchmarkResult:
         """
         Benchmark bidirectional streaming performance.
@@ -293,109 +620,128 @@ class StreamBenchmark:
             messages_per_stream: Messages per stream
             message_size: Size of each message in bytes
             async_mode: Use async or sync bidirectional stream
+            warmup_iterations: Untimed streams to run before measuring
+            target_rps: Total message rate to pace the streams at, unpaced if None
+            total_streams: Streams to run in total, at most num_concurrent at a
+                time (default: num_concurrent)
         """
         test_name = (
             "bidirectional_stream_async" if async_mode else "bidirectional_stream_sync"
         )
 
+        total_streams = total_streams or num_concurrent
         logger.info(
-            f"Benchmarking {test_name}: {num_concurrent} concurrent, "
-            f"{messages_per_stream} msgs/stream, {message_size} bytes/msg"
+            "Benchmarking %s: %d concurrent, %d msgs/stream, %d bytes/msg",
+            test_name,
+            num_concurrent,
+            messages_per_stream,
+            message_size,
         )
 
-        latencies = []
-        errors = 0
-        total_requests = 0
-        total_responses = 0
+        # Shared by all tasks, the payload is not part of what is being measured
+        request = echo_request(message_size)
+        interval_ns = send_interval(target_rps, num_concurrent)
 
-        def bidirectional_stream_task(task_id: int) -> Tuple[float, int, int, int]:
+        async def bidirectional_stream_task(
+            task_id: int,
+        ) -> Tuple[List[int], int, int, int]:
             """Single bidirectional streaming task."""
-            start_time = time.time()
+            stub = self._stub(task_id)
+            # Send (or, when paced, due) time of every request,
+            # the i-th response answers the i-th request
+            send_times = [0] * messages_per_stream
+            message_latencies = []
             local_requests = 0
             local_responses = 0
             local_errors = 0
 
             try:
 
-                def generate_requests():
+                async def generate_requests():
                     nonlocal local_requests
-                    message_data = "x" * message_size
+                    stream_start = time.perf_counter_ns()
                     for i in range(messages_per_stream):
                         local_requests += 1
-                        yield stream_pb2.EchoRequest(
-                            message=f"Task-{task_id}-Msg-{i}: {message_data}"
+                        send_times[i] = (
+                            await wait_until_due(stream_start, i, interval_ns)
+                            if interval_ns
+                            else time.perf_counter_ns()
                         )
+                        yield request
 
                 if async_mode:
-                    response_stream = self.stub.EchoBidirectionalStreamAsync(
+                    response_stream = stub.EchoBidirectionalStreamAsync(
                         generate_requests()
                     )
                 else:
-                    response_stream = self.stub.EchoBidirectionalStreamSync(
+                    response_stream = stub.EchoBidirectionalStreamSync(
                         generate_requests()
                     )
 
-                for response in response_stream:
+                async for response in response_stream:
+                    message_latencies.append(
+                        time.perf_counter_ns() - send_times[local_responses]
+                    )
                     local_responses += 1
 
             except Exception as e:
-                logger.error(f"Bidirectional stream task {task_id} error: {e}")
+                logger.error("Bidirectional stream task %d error: %s", task_id, e)
                 local_errors += 1
 
-            duration = time.time() - start_time
-            return duration, local_requests, local_responses, local_errors
+            return message_latencies, local_requests, local_responses, local_errors
 
-        # Measure initial system state
-        start_cpu, start_memory = self._measure_system_usage()
-        benchmark_start = time.time()
+        warmup_duration = await self._warm_up(
+            bidirectional_stream_task, warmup_iterations
+        )
 
-        # Run concurrent bidirectional streaming tasks
-        with ThreadPoolExecutor(max_workers=num_concurrent) as executor:
-            futures = [
-                executor.submit(bidirectional_stream_task, i)
-                for i in range(num_concurrent)
-            ]
+        # Sample system usage over the timed region
+        usage_sampler = self._start_usage_sampler()
+        benchmark_start = time.perf_counter_ns()
 
-            for future in as_completed(futures):
-                duration, requests, responses, task_errors = future.result()
-                latencies.append(duration)
-                total_requests += requests
-                total_responses += responses
-                errors += task_errors
+        # Run bidirectional streaming tasks on the event loop
+        task_results = await self._run_streams(
+            bidirectional_stream_task, num_concurrent, total_streams
+        )
 
-        benchmark_duration = time.time() - benchmark_start
+        # Stop the clock before any aggregation
+        benchmark_duration = (time.perf_counter_ns() - benchmark_start) / NS_PER_SECOND
+        cpu_usage_percent, memory_usage_mb = usage_sampler.stop()
 
-        # Measure final system state
-        end_cpu, end_memory = self._measure_system_usage()
+        message_latencies, total_requests, total_responses, errors = join_task_results(
+            task_results
+        )
+        latencies = list(itertools.chain.from_iterable(message_latencies))
 
         return BenchmarkResult(
             test_name=test_name,
+            num_concurrent=num_concurrent,
+            total_streams=total_streams,
+            message_size=message_size,
+            messages_per_stream=messages_per_stream,
+            target_rps=target_rps,
             total_requests=total_requests,
             total_responses=total_responses,
             total_duration=benchmark_duration,
-            avg_latency=statistics.mean(latencies) if latencies else 0,
-            min_latency=min(latencies) if latencies else 0,
-            max_latency=max(latencies) if latencies else 0,
-            p95_latency=statistics.quantiles(latencies, n=20)[18]
-            if len(latencies) > 20
-            else max(latencies)
-            if latencies
-            else 0,
+            warmup_duration=warmup_duration,
+            **latency_stats(latencies),
             requests_per_second=total_requests / benchmark_duration,
             responses_per_second=total_responses / benchmark_duration,
-            cpu_usage_percent=(start_cpu + end_cpu) / 2,
-            memory_usage_mb=(start_memory + end_memory) / 2,
+            cpu_usage_percent=cpu_usage_percent,
+            memory_usage_mb=memory_usage_mb,
             errors=errors,
-            success_rate=((num_concurrent - errors) / num_concurrent * 100)
-            if num_concurrent > 0
+            success_rate=((total_streams - errors) / total_streams * 100)
+            if total_streams > 0
             else 0,
         )
 
-    def run_all_benchmarks(
+    async def run_all_benchmarks(
         self,
         concurrent_levels: List[int] = None,
         message_sizes: List[int] = None,
         messages_per_stream: int = 100,
+        warmup_iterations: int = 8,
+        target_rps: Optional[float] = None,
+        total_streams: Optional[int] = None,
     ) -> Dict[str, List[BenchmarkResult]]:
         """
         Run comprehensive benchmark suite.
@@ -404,6 +750,11 @@ class StreamBenchmark:
             concurrent_levels: List of concurrency levels to test
             message_sizes: List of message sizes to test
             messages_per_stream: Number of messages per stream for applicable tests
+            warmup_iterations: Untimed streams to run before each test
+            target_rps: Total message rate to pace client and bidirectional
+                streams at, unpaced if None
+            total_streams: Streams to run per test, at most the concurrency
+                level at a time (default: the concurrency level)
         """
         if concurrent_levels is None:
             concurrent_levels = [1, 5, 10, 20, 50]
@@ -417,135 +768,216 @@ class StreamBenchmark:
             "bidirectional_async": [],
         }
 
-        self.connect()
+        self.connect(max(concurrent_levels))
 
         try:
             for concurrent in concurrent_levels:
                 for message_size in message_sizes:
                     logger.info(
-                        f"Running benchmarks: concurrent={concurrent}, message_size={message_size}"
+                        "Running benchmarks: concurrent=%d, message_size=%d",
+                        concurrent,
+                        message_size,
                     )
 
                     # Client streaming
-                    result = self.benchmark_client_stream(
+                    result = await self.benchmark_client_stream(
                         num_concurrent=concurrent,
                         messages_per_stream=messages_per_stream,
                         message_size=message_size,
+                        warmup_iterations=warmup_iterations,
+                        target_rps=target_rps,
+                        total_streams=total_streams,
                     )
                     results["client_stream"].append(result)
 
                     # Server streaming
-                    result = self.benchmark_server_stream(
+                    result = await self.benchmark_server_stream(
                         num_concurrent=concurrent,
                         message_size=message_size,
+                        warmup_iterations=warmup_iterations,
+                        total_streams=total_streams,
                     )
                     results["server_stream"].append(result)
 
                     # Bidirectional sync streaming
-                    result = self.benchmark_bidirectional_stream(
+                    result = await self.benchmark_bidirectional_stream(
                         num_concurrent=concurrent,
                         messages_per_stream=messages_per_stream
                         // 2,  # Fewer messages for bidirectional
                         message_size=message_size,
+                        warmup_iterations=warmup_iterations,
                         async_mode=False,
+                        target_rps=target_rps,
+                        total_streams=total_streams,
                     )
                     results["bidirectional_sync"].append(result)
 
                     # Bidirectional async streaming
-                    result = self.benchmark_bidirectional_stream(
+                    result = await self.benchmark_bidirectional_stream(
                         num_concurrent=concurrent,
                         messages_per_stream=messages_per_stream // 2,
                         message_size=message_size,
+                        warmup_iterations=warmup_iterations,
                         async_mode=True,
+                        target_rps=target_rps,
+                        total_streams=total_streams,
                     )
                     results["bidirectional_async"].append(result)
 
-                    # Small delay between test configurations
-                    time.sleep(1)
-
         finally:
-            self.disconnect()
+            await self.disconnect()
 
         return results
 
 
 def print_results(results: Dict[str, List[BenchmarkResult]]):
     """Print benchmark results in a formatted table."""
-    print("\n" + "=" * 120)
+    print("\n" + "=" * 138)
     print("GRPC STREAMING PERFORMANCE BENCHMARK RESULTS")
-    print("=" * 120)
+    print("=" * 138)
 
     for test_type, test_results in results.items():
         print(f"\n{test_type.upper().replace('_', ' ')}:")
-        print("-" * 120)
+        print("-" * 138)
 
         # Header
         print(
             f"{'Concurrent':<12} {'MsgSize':<10} {'Requests':<10} {'Responses':<11} "
-            f"{'RPS':<8} {'Resp/s':<8} {'AvgLat':<8} {'P95Lat':<8} {'CPU%':<6} "
+            f"{'RPS':<8} {'Resp/s':<8} {'AvgLat':<8} {'P50Lat':<8} {'P95Lat':<8} "
+            f"{'P99Lat':<8} {'CPU%':<6} "
             f"{'Mem(MB)':<8} {'Errors':<7} {'Success%':<8}"
         )
-        print("-" * 120)
+        print("-" * 138)
 
         for result in test_results:
-            # Extract concurrent level and message size from the test parameters
-            # This is a simplified approach - in a real implementation you'd store these separately
             print(
-                f"{10:<12} {1024:<10} {result.total_requests:<10} {result.total_responses:<11} "
+                f"{result.num_concurrent:<12} {result.message_size:<10} "
+                f"{result.total_requests:<10} {result.total_responses:<11} "
                 f"{result.requests_per_second:<8.1f} {result.responses_per_second:<8.1f} "
-                f"{result.avg_latency * 1000:<8.1f} {result.p95_latency * 1000:<8.1f} "
+                f"{result.avg_latency * 1000:<8.1f} {result.p50_latency * 1000:<8.1f} "
+                f"{result.p95_latency * 1000:<8.1f} {result.p99_latency * 1000:<8.1f} "
                 f"{result.cpu_usage_percent:<6.1f} {result.memory_usage_mb:<8.1f} "
                 f"{result.errors:<7} {result.success_rate:<8.1f}"
             )
 
 
+def parse_grpc_option(option: str) -> Tuple[str, object]:
+    """
+    Parse a key=value gRPC channel option from the command line.
+
+    Args:
+        option: Option in key=value form, integer values are converted to int
+
+    Returns:
+        Option name and value
+    """
+    key, sep, value = option.partition("=")
+    if not sep or not key:
+        raise argparse.ArgumentTypeError(f"expected key=value, got {option!r}")
+    try:
+        return key, int(value)
+    except ValueError:
+        return key, value
+
+
 def export_results_csv(results: Dict[str, List[BenchmarkResult]], filename: str):
     """Export results to CSV file."""
     import csv
 
+    columns = [field.name for field in fields(BenchmarkResult)]
+    # Latencies are kept in seconds but exported in milliseconds
+    latency_columns = {"avg_latency", "min_latency", "max_latency"}
+    latency_columns.update(LATENCY_PERCENTILES)
+    header = [f"{name}_ms" if name in latency_columns else name for name in columns]
+    header[columns.index("test_name")] = "test_type"
+
     with open(filename, "w", newline="") as csvfile:
-        fieldnames = [
-            "test_type",
-            "total_requests",
-            "total_responses",
-            "total_duration",
-            "avg_latency_ms",
-            "min_latency_ms",
-            "max_latency_ms",
-            "p95_latency_ms",
-            "requests_per_second",
-            "responses_per_second",
-            "cpu_usage_percent",
-            "memory_usage_mb",
-            "errors",
-            "success_rate",
-        ]
+        writer = csv.writer(csvfile)
+        writer.writerow(header)
+        writer.writerows(
+            [
+                value * 1000 if name in latency_columns else value
+                for name, value in vars(result).items()
+            ]
+            for result in itertools.chain.from_iterable(results.values())
+        )
+
+    logger.info("Results exported to %s", filename)
+
+
+async def run_benchmarks(
+    benchmark: StreamBenchmark, args: argparse.Namespace
+) -> Dict[str, List[BenchmarkResult]]:
+    """
+    Run the benchmarks selected on the command line.
+
+    Args:
+        benchmark: Benchmark client
+        args: Parsed command line arguments
+    """
+    if args.test == "all":
+        results = await benchmark.run_all_benchmarks(
+            concurrent_levels=args.concurrent,
+            message_sizes=args.message_size,
+            messages_per_stream=args.messages_per_stream,
+            warmup_iterations=args.warmup,
+            target_rps=args.target_rps,
+            total_streams=args.streams,
+        )
+    else:
+        # Run specific test
+        benchmark.connect(args.concurrent[0])
+        results = {}
+
+        try:
+            if args.test == "client":
+                results["client_stream"] = [
+                    await benchmark.benchmark_client_stream(
+                        num_concurrent=args.concurrent[0],
+                        messages_per_stream=args.messages_per_stream,
+                        message_size=args.message_size[0],
+                        warmup_iterations=args.warmup,
+                        target_rps=args.target_rps,
+                        total_streams=args.streams,
+                    )
+                ]
+            elif args.test == "server":
+                results["server_stream"] = [
+                    await benchmark.benchmark_server_stream(
+                        num_concurrent=args.concurrent[0],
+                        message_size=args.message_size[0],
+                        warmup_iterations=args.warmup,
+                        total_streams=args.streams,
+                    )
+                ]
+            elif args.test == "sync":
+                results["bidirectional_sync"] = [
+                    await benchmark.benchmark_bidirectional_stream(
+                        num_concurrent=args.concurrent[0],
+                        messages_per_stream=args.messages_per_stream,
+                        message_size=args.message_size[0],
+                        async_mode=False,
+                        warmup_iterations=args.warmup,
+                        target_rps=args.target_rps,
+                        total_streams=args.streams,
+                    )
+                ]
+            elif args.test == "async":
+                results["bidirectional_async"] = [
+                    await benchmark.benchmark_bidirectional_stream(
+                        num_concurrent=args.concurrent[0],
+                        messages_per_stream=args.messages_per_stream,
+                        message_size=args.message_size[0],
+                        async_mode=True,
+                        warmup_iterations=args.warmup,
+                        target_rps=args.target_rps,
+                        total_streams=args.streams,
+                    )
+                ]
+        finally:
+            await benchmark.disconnect()
 
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for test_type, test_results in results.items():
-            for result in test_results:
-                writer.writerow(
-                    {
-                        "test_type": result.test_name,
-                        "total_requests": result.total_requests,
-                        "total_responses": result.total_responses,
-                        "total_duration": result.total_duration,
-                        "avg_latency_ms": result.avg_latency * 1000,
-                        "min_latency_ms": result.min_latency * 1000,
-                        "max_latency_ms": result.max_latency * 1000,
-                        "p95_latency_ms": result.p95_latency * 1000,
-                        "requests_per_second": result.requests_per_second,
-                        "responses_per_second": result.responses_per_second,
-                        "cpu_usage_percent": result.cpu_usage_percent,
-                        "memory_usage_mb": result.memory_usage_mb,
-                        "errors": result.errors,
-                        "success_rate": result.success_rate,
-                    }
-                )
-
-    logger.info(f"Results exported to {filename}")
+    return results
 
 
 def main():
@@ -584,6 +1016,40 @@ def main():
         default=100,
         help="Messages per stream for client/bidirectional tests (default: 100)",
     )
+    parser.add_argument(
+        "--warmup",
+        type=int,
+        default=8,
+        help="Untimed warmup streams to run before each test (default: 8)",
+    )
+    parser.add_argument(
+        "--streams",
+        type=int,
+        help="Total streams to run per test, at most --concurrent of them in "
+        "flight at a time (default: same as the concurrency level)",
+    )
+    parser.add_argument(
+        "--target-rps",
+        type=float,
+        help="Total message rate to pace client and bidirectional streams at; "
+        "latency is then measured from each message's scheduled send time "
+        "(default: send as fast as possible)",
+    )
+    parser.add_argument(
+        "--channels",
+        type=int,
+        help="Number of channels to spread streams over "
+        "(default: one per concurrent stream, up to the number of CPUs)",
+    )
+    parser.add_argument(
+        "--grpc-option",
+        type=parse_grpc_option,
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help="gRPC channel option, may be repeated "
+        "(e.g. --grpc-option grpc.keepalive_time_ms=10000)",
+    )
     parser.add_argument("--output", type=str, help="Output CSV file for results")
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
 
@@ -593,59 +1059,18 @@ def main():
         logging.getLogger().setLevel(logging.DEBUG)
 
     logger.info("Starting gRPC Streaming Performance Benchmark...")
-    logger.info(f"Server: {args.server}")
-    logger.info(f"Concurrency levels: {args.concurrent}")
-    logger.info(f"Message sizes: {args.message_size}")
-
-    benchmark = StreamBenchmark(args.server)
+    logger.info("Server: %s", args.server)
+    logger.info("Concurrency levels: %s", args.concurrent)
+    logger.info("Message sizes: %s", args.message_size)
+
+    benchmark = StreamBenchmark(
+        args.server,
+        pool_size=args.channels,
+        channel_options=dict(args.grpc_option),
+    )
 
     try:
-        if args.test == "all":
-            results = benchmark.run_all_benchmarks(
-                concurrent_levels=args.concurrent,
-                message_sizes=args.message_size,
-                messages_per_stream=args.messages_per_stream,
-            )
-        else:
-            # Run specific test
-            benchmark.connect()
-            results = {}
-
-            if args.test == "client":
-                results["client_stream"] = [
-                    benchmark.benchmark_client_stream(
-                        num_concurrent=args.concurrent[0],
-                        messages_per_stream=args.messages_per_stream,
-                        message_size=args.message_size[0],
-                    )
-                ]
-            elif args.test == "server":
-                results["server_stream"] = [
-                    benchmark.benchmark_server_stream(
-                        num_concurrent=args.concurrent[0],
-                        message_size=args.message_size[0],
-                    )
-                ]
-            elif args.test == "sync":
-                results["bidirectional_sync"] = [
-                    benchmark.benchmark_bidirectional_stream(
-                        num_concurrent=args.concurrent[0],
-                        messages_per_stream=args.messages_per_stream,
-                        message_size=args.message_size[0],
-                        async_mode=False,
-                    )
-                ]
-            elif args.test == "async":
-                results["bidirectional_async"] = [
-                    benchmark.benchmark_bidirectional_stream(
-                        num_concurrent=args.concurrent[0],
-                        messages_per_stream=args.messages_per_stream,
-                        message_size=args.message_size[0],
-                        async_mode=True,
-                    )
-                ]
-
-            benchmark.disconnect()
+        results = asyncio.run(run_benchmarks(benchmark, args))
 
         # Print results
         print_results(results)
@@ -657,7 +1082,7 @@ def main():
     except KeyboardInterrupt:
         logger.info("Benchmark interrupted by user")
     except Exception as e:
-        logger.error(f"Benchmark failed: {e}")
+        logger.error("Benchmark failed: %s", e)
         sys.exit(1)
 
     logger.info("Benchmark completed")
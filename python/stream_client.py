@@ -5,20 +5,17 @@ Tests all streaming patterns: client streaming, server streaming, and bidirectio
 """
 
 import asyncio
+import itertools
 import logging
 import signal
-import sys
-import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
-from typing import Iterator, List, Optional
-import random
 
 import grpc
 
 # Import generated protobuf/grpc code
 from api.stream.v1 import stream_pb2
 from api.stream.v1 import stream_pb2_grpc
+from protobuf_backend import check_protobuf_backend
 
 
 # Configure logging
@@ -30,79 +27,184 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-class StreamClientInterceptor(
-    grpc.UnaryUnaryClientInterceptor,
-    grpc.UnaryStreamClientInterceptor,
-    grpc.StreamUnaryClientInterceptor,
-    grpc.StreamStreamClientInterceptor,
-):
+class StreamClientInterceptor:
     """Client interceptor for logging all types of RPC calls."""
 
-    def intercept_unary_unary(self, continuation, client_call_details, request):
-        start_time = time.time()
-        response = continuation(client_call_details, request)
-        duration = time.time() - start_time
-        logger.info(
-            f"[INTERCEPTOR] {client_call_details.method} (unary-unary) completed in {duration:.3f}s"
+    @staticmethod
+    def _log_when_done(call, client_call_details, call_type: str, start_time: int):
+        """Log the call's duration once it completes and return the call."""
+        # The call is only started here, log once it has finished
+        call.add_done_callback(
+            lambda _: logger.debug(
+                "[INTERCEPTOR] %s (%s) completed in %d us",
+                client_call_details.method.decode(),
+                call_type,
+                (time.monotonic_ns() - start_time) // 1000,
+            )
         )
-        return response
-
-    def intercept_unary_stream(self, continuation, client_call_details, request):
-        logger.info(
-            f"[INTERCEPTOR] Starting {client_call_details.method} (unary-stream)"
+        return call
+
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        start_time = time.monotonic_ns()
+        call = await continuation(client_call_details, request)
+        return self._log_when_done(call, client_call_details, "unary-unary", start_time)
+
+    async def intercept_unary_stream(self, continuation, client_call_details, request):
+        start_time = time.monotonic_ns()
+        call = await continuation(client_call_details, request)
+        return self._log_when_done(
+            call, client_call_details, "unary-stream", start_time
         )
-        return continuation(client_call_details, request)
 
-    def intercept_stream_unary(
+    async def intercept_stream_unary(
         self, continuation, client_call_details, request_iterator
     ):
-        start_time = time.time()
-        response = continuation(client_call_details, request_iterator)
-        duration = time.time() - start_time
-        logger.info(
-            f"[INTERCEPTOR] {client_call_details.method} (stream-unary) completed in {duration:.3f}s"
+        start_time = time.monotonic_ns()
+        call = await continuation(client_call_details, request_iterator)
+        return self._log_when_done(
+            call, client_call_details, "stream-unary", start_time
         )
-        return response
 
-    def intercept_stream_stream(
+    async def intercept_stream_stream(
         self, continuation, client_call_details, request_iterator
     ):
-        logger.info(
-            f"[INTERCEPTOR] Starting {client_call_details.method} (stream-stream)"
+        start_time = time.monotonic_ns()
+        call = await continuation(client_call_details, request_iterator)
+        return self._log_when_done(
+            call, client_call_details, "stream-stream", start_time
         )
-        return continuation(client_call_details, request_iterator)
+
+
+# grpc.aio registers an interceptor for the first call type it implements only,
+# so the channel gets a separate interceptor per call type
+class UnaryUnaryInterceptor(
+    StreamClientInterceptor, grpc.aio.UnaryUnaryClientInterceptor
+):
+    pass
+
+
+class UnaryStreamInterceptor(
+    StreamClientInterceptor, grpc.aio.UnaryStreamClientInterceptor
+):
+    pass
+
+
+class StreamUnaryInterceptor(
+    StreamClientInterceptor, grpc.aio.StreamUnaryClientInterceptor
+):
+    pass
+
+
+class StreamStreamInterceptor(
+    StreamClientInterceptor, grpc.aio.StreamStreamClientInterceptor
+):
+    pass
+
+
+class ChannelPool:
+    """Channels shared by all test clients, handed out round-robin."""
+
+    def __init__(self, server_address: str = "localhost:8080", size: int = 4):
+        """
+        Open the pool's channels.
+
+        Args:
+            server_address: Server address in format "host:port"
+            size: Number of channels in the pool
+        """
+        # The interceptors only log at DEBUG, so channels skip them otherwise
+        interceptors = None
+        if logger.isEnabledFor(logging.DEBUG):
+            interceptors = [
+                UnaryUnaryInterceptor(),
+                UnaryStreamInterceptor(),
+                StreamUnaryInterceptor(),
+                StreamStreamInterceptor(),
+            ]
+
+        self.channels = [
+            grpc.aio.insecure_channel(
+                server_address,
+                options=[
+                    ("grpc.max_send_message_length", 50 * 1024 * 1024),  # 50MB
+                    ("grpc.max_receive_message_length", 50 * 1024 * 1024),  # 50MB
+                    # Keep a separate connection per channel instead of letting
+                    # them share one HTTP/2 connection
+                    ("grpc.use_local_subchannel_pool", 1),
+                ],
+                interceptors=interceptors,
+            )
+            for _ in range(size)
+        ]
+        # One stub per channel, shared by every client that lands on it
+        self.stubs = [
+            stream_pb2_grpc.EchoServiceStub(channel) for channel in self.channels
+        ]
+        self._counter = itertools.count()
+
+    def next_stub(self) -> stream_pb2_grpc.EchoServiceStub:
+        """Return the stub of the next channel in round-robin order."""
+        return self.stubs[next(self._counter) % len(self.stubs)]
+
+    async def close(self):
+        """Close all channels in the pool."""
+        await asyncio.gather(*(channel.close() for channel in self.channels))
 
 
 class EchoStreamClient:
     """Client for testing all streaming patterns."""
 
-    def __init__(self, server_address: str = "localhost:8080"):
+    def __init__(
+        self,
+        pool: ChannelPool,
+        pacing_ms: int = 0,
+        payload_size: int = 0,
+        payload_only: bool = False,
+    ):
         """
         Initialize the client.
 
         Args:
-            server_address: Server address in format "host:port"
+            pool: Channel pool to take the client's stub from
+            pacing_ms: Delay between sent messages in milliseconds, 0 for none
+            payload_size: Size of the bytes payload sent with every message
+            payload_only: Send only the payload, without the readable message
         """
-        self.server_address = server_address
-
-        # Create intercepted channel
-        channel = grpc.insecure_channel(
-            server_address,
-            options=[
-                ("grpc.max_send_message_length", 50 * 1024 * 1024),  # 50MB
-                ("grpc.max_receive_message_length", 50 * 1024 * 1024),  # 50MB
-            ],
-        )
-
-        self.channel = grpc.intercept_channel(channel, StreamClientInterceptor())
-        self.stub = stream_pb2_grpc.EchoServiceStub(self.channel)
+        self.pacing = pacing_ms / 1000
+        self.payload_only = payload_only
+        self.stub = pool.next_stub()
         self.client_id = None
 
-    def close(self):
-        """Close the client connection."""
-        self.channel.close()
+        # The payload is allocated once and shared by every request
+        self.payload = b"x" * payload_size
+        self.request = stream_pb2.EchoRequest(payload=self.payload)
 
-    def test_client_stream(self, client_id: int, num_messages: int = 3) -> bool:
+    def _request(
+        self, client_id: int, action: str, message_format: str, *args
+    ) -> stream_pb2.EchoRequest:
+        """
+        Build the next request of a test stream.
+
+        In payload-only mode the prebuilt request without a message is sent,
+        so no text is formatted per message.
+
+        Args:
+            client_id: Client identifier
+            action: What is being sent, for the log
+            message_format: %-format of the message text
+            *args: Arguments for message_format
+
+        Returns:
+            Request to send
+        """
+        if self.payload_only:
+            return self.request
+
+        message = message_format % args
+        logger.debug("[Client-%d] %s: %s", client_id, action, message)
+        return stream_pb2.EchoRequest(message=message, payload=self.payload)
+
+    async def test_client_stream(self, client_id: int, num_messages: int = 3) -> bool:
         """
         Test client streaming - send multiple messages, receive one response.
 
@@ -113,31 +215,39 @@ class EchoStreamClient:
         Returns:
             True if successful, False otherwise
         """
-        logger.info(f"[Client-{client_id}] Starting client stream test")
+        logger.info("[Client-%d] Starting client stream test", client_id)
 
-        def generate_requests():
+        async def generate_requests():
             """Generator function for client requests."""
             for i in range(1, num_messages + 1):
-                message = f"Hello from client-{client_id} message-{i}"
-                logger.info(f"[Client-{client_id}] Sending: {message}")
-                yield stream_pb2.EchoRequest(message=message)
-                time.sleep(0.5)  # Small delay between messages
+                yield self._request(
+                    client_id,
+                    "Sending",
+                    "Hello from client-%d message-%d",
+                    client_id,
+                    i,
+                )
+                if self.pacing:
+                    await asyncio.sleep(self.pacing)  # Optional delay between messages
 
         try:
             # Call client streaming RPC
-            response = self.stub.EchoClientStream(generate_requests())
+            response = await self.stub.EchoClientStream(generate_requests())
             logger.info(
-                f"[Client-{client_id}] Client stream response: {response.message}"
+                "[Client-%d] Client stream response: %s", client_id, response.message
             )
             return True
 
         except grpc.RpcError as e:
             logger.error(
-                f"[Client-{client_id}] Client stream error: {e.code()}: {e.details()}"
+                "[Client-%d] Client stream error: %s: %s",
+                client_id,
+                e.code(),
+                e.details(),
             )
             return False
 
-    def test_server_stream(self, client_id: int) -> bool:
+    async def test_server_stream(self, client_id: int) -> bool:
         """
         Test server streaming - send one message, receive multiple responses.
 
@@ -147,38 +257,47 @@ class EchoStreamClient:
         Returns:
             True if successful, False otherwise
         """
-        logger.info(f"[Client-{client_id}] Starting server stream test")
+        logger.info("[Client-%d] Starting server stream test", client_id)
 
-        request = stream_pb2.EchoRequest(
-            message=f"Hello from client-{client_id} for server stream"
+        request = self._request(
+            client_id,
+            "Sent request",
+            "Hello from client-%d for server stream",
+            client_id,
         )
 
         try:
-            logger.info(f"[Client-{client_id}] Sent request: {request.message}")
-
             # Call server streaming RPC
             response_stream = self.stub.EchoServerStream(request)
 
             # Receive all responses
             response_count = 0
-            for response in response_stream:
+            async for response in response_stream:
                 response_count += 1
-                logger.info(
-                    f"[Client-{client_id}] Server stream response #{response_count}: {response.message}"
+                logger.debug(
+                    "[Client-%d] Server stream response #%d: %s",
+                    client_id,
+                    response_count,
+                    response.message,
                 )
 
             logger.info(
-                f"[Client-{client_id}] Server stream finished, received {response_count} responses"
+                "[Client-%d] Server stream finished, received %d responses",
+                client_id,
+                response_count,
             )
             return True
 
         except grpc.RpcError as e:
             logger.error(
-                f"[Client-{client_id}] Server stream error: {e.code()}: {e.details()}"
+                "[Client-%d] Server stream error: %s: %s",
+                client_id,
+                e.code(),
+                e.details(),
             )
             return False
 
-    def test_bidirectional_stream_sync(
+    async def test_bidirectional_stream_sync(
         self, client_id: int, num_messages: int = 3
     ) -> bool:
         """
@@ -191,15 +310,20 @@ class EchoStreamClient:
         Returns:
             True if successful, False otherwise
         """
-        logger.info(f"[Client-{client_id}] Starting bidirectional stream sync test")
+        logger.info("[Client-%d] Starting bidirectional stream sync test", client_id)
 
-        def generate_requests():
+        async def generate_requests():
             """Generator function for client requests."""
             for i in range(1, num_messages + 1):
-                message = f"Sync message {i} from client-{client_id}"
-                logger.info(f"[Client-{client_id}] Sending sync: {message}")
-                yield stream_pb2.EchoRequest(message=message)
-                time.sleep(1.0)  # Delay between messages
+                yield self._request(
+                    client_id,
+                    "Sending sync",
+                    "Sync message %d from client-%d",
+                    i,
+                    client_id,
+                )
+                if self.pacing:
+                    await asyncio.sleep(self.pacing)  # Optional delay between messages
 
         try:
             # Call bidirectional streaming RPC
@@ -207,27 +331,37 @@ class EchoStreamClient:
 
             # Receive all responses
             response_count = 0
-            for response in response_stream:
+            async for response in response_stream:
                 response_count += 1
-                logger.info(
-                    f"[Client-{client_id}] Sync response #{response_count}: {response.message}"
+                logger.debug(
+                    "[Client-%d] Sync response #%d: %s",
+                    client_id,
+                    response_count,
+                    response.message,
                 )
 
-            logger.info(f"[Client-{client_id}] Bidirectional sync stream finished")
+            logger.info(
+                "[Client-%d] Bidirectional sync stream finished, received %d responses",
+                client_id,
+                response_count,
+            )
             return True
 
         except grpc.RpcError as e:
             logger.error(
-                f"[Client-{client_id}] Bidirectional sync error: {e.code()}: {e.details()}"
+                "[Client-%d] Bidirectional sync error: %s: %s",
+                client_id,
+                e.code(),
+                e.details(),
             )
             return False
 
-    def test_bidirectional_stream_async(
+    async def test_bidirectional_stream_async(
         self, client_id: int, num_messages: int = 3
     ) -> bool:
         """
         Test bidirectional streaming with asynchronous pattern.
-        Uses separate threads for sending and receiving.
+        Sends and receives concurrently from two coroutines on the same call.
 
         Args:
             client_id: Client identifier
@@ -236,145 +370,239 @@ class EchoStreamClient:
         Returns:
             True if successful, False otherwise
         """
-        logger.info(f"[Client-{client_id}] Starting bidirectional stream async test")
-
-        # Event to coordinate threads
-        stop_event = threading.Event()
-        send_complete = threading.Event()
-        success = True
-
-        def send_requests():
-            """Thread function for sending requests."""
-            try:
-                for i in range(1, num_messages + 1):
-                    if stop_event.is_set():
-                        break
-
-                    message = f"Async message {i} from client-{client_id}"
-                    logger.info(f"[Client-{client_id}] Sending async: {message}")
-                    yield stream_pb2.EchoRequest(message=message)
-                    time.sleep(0.8)  # Delay between messages
-
-            except Exception as e:
-                logger.error(f"[Client-{client_id}] Error sending async requests: {e}")
-            finally:
-                send_complete.set()
-                logger.info(f"[Client-{client_id}] Finished sending async requests")
-
-        def receive_responses(response_stream):
-            """Thread function for receiving responses."""
-            nonlocal success
-            try:
-                response_count = 0
-                for response in response_stream:
-                    if stop_event.is_set():
-                        break
-                    response_count += 1
-                    logger.info(
-                        f"[Client-{client_id}] Async response #{response_count}: {response.message}"
+        logger.info("[Client-%d] Starting bidirectional stream async test", client_id)
+
+        async def send_requests(call):
+            """Write requests to the call, then half-close it."""
+            for i in range(1, num_messages + 1):
+                await call.write(
+                    self._request(
+                        client_id,
+                        "Sending async",
+                        "Async message %d from client-%d",
+                        i,
+                        client_id,
                     )
+                )
+                if self.pacing:
+                    await asyncio.sleep(self.pacing)  # Optional delay between messages
 
-                logger.info(f"[Client-{client_id}] Finished receiving async responses")
+            await call.done_writing()
+            logger.info("[Client-%d] Finished sending async requests", client_id)
 
-            except grpc.RpcError as e:
-                logger.error(
-                    f"[Client-{client_id}] Error receiving async responses: {e.code()}: {e.details()}"
-                )
-                success = False
-            except Exception as e:
-                logger.error(
-                    f"[Client-{client_id}] Unexpected error receiving async responses: {e}"
+        async def receive_responses(call):
+            """Read responses until the server closes the stream."""
+            response_count = 0
+            async for response in call:
+                response_count += 1
+                logger.debug(
+                    "[Client-%d] Async response #%d: %s",
+                    client_id,
+                    response_count,
+                    response.message,
                 )
-                success = False
-
-        try:
-            # Start bidirectional stream
-            response_stream = self.stub.EchoBidirectionalStreamAsync(send_requests())
 
-            # Start receiver thread
-            receiver_thread = threading.Thread(
-                target=receive_responses, args=(response_stream,), daemon=True
+            logger.info(
+                "[Client-%d] Finished receiving %d async responses",
+                client_id,
+                response_count,
             )
-            receiver_thread.start()
 
-            # Wait for sending to complete
-            send_complete.wait(timeout=10)
-
-            # Wait a bit more for responses
-            time.sleep(2)
-
-            # Signal stop and wait for receiver
-            stop_event.set()
-            receiver_thread.join(timeout=5)
+        try:
+            # Start bidirectional stream without a request iterator, requests
+            # are written to the call directly
+            call = self.stub.EchoBidirectionalStreamAsync()
+            await asyncio.gather(send_requests(call), receive_responses(call))
 
-            logger.info(f"[Client-{client_id}] Bidirectional async stream finished")
-            return success
+            logger.info("[Client-%d] Bidirectional async stream finished", client_id)
+            return True
 
         except grpc.RpcError as e:
             logger.error(
-                f"[Client-{client_id}] Bidirectional async error: {e.code()}: {e.details()}"
+                "[Client-%d] Bidirectional async error: %s: %s",
+                client_id,
+                e.code(),
+                e.details(),
             )
             return False
         except Exception as e:
-            logger.error(f"[Client-{client_id}] Unexpected error in async stream: {e}")
+            logger.error(
+                "[Client-%d] Unexpected error in async stream: %s", client_id, e
+            )
             return False
 
 
-def run_client_tests(client_id: int, server_address: str, stop_event: threading.Event):
+async def wait_for_stop(stop_event: asyncio.Event, timeout: float) -> bool:
+    """
+    Wait until the stop event is set or the timeout expires.
+
+    Args:
+        stop_event: Event to signal stop
+        timeout: Maximum time to wait in seconds
+
+    Returns:
+        True if the stop event was set, False on timeout
+    """
+    try:
+        await asyncio.wait_for(stop_event.wait(), timeout)
+    except asyncio.TimeoutError:
+        return False
+    return True
+
+
+async def run_client_tests(
+    client_id: int,
+    pool: ChannelPool,
+    stop_event: asyncio.Event,
+    pacing_ms: int = 0,
+    payload_size: int = 0,
+    payload_only: bool = False,
+):
     """
     Run all streaming tests for a single client.
 
     Args:
         client_id: Client identifier
-        server_address: Server address
+        pool: Channel pool shared by the clients
         stop_event: Event to signal stop
+        pacing_ms: Delay between sent messages in milliseconds, 0 for none
+        payload_size: Size of the bytes payload sent with every message
+        payload_only: Send only the payload, without the readable message
     """
-    client = EchoStreamClient(server_address)
+    client = EchoStreamClient(pool, pacing_ms, payload_size, payload_only)
 
     try:
         while not stop_event.is_set():
             # Determine which test to run based on client_id
             if client_id == 1:
                 # Client Stream Test
-                success = client.test_client_stream(client_id)
+                success = await client.test_client_stream(client_id)
                 if not success:
-                    logger.warning(f"[Client-{client_id}] Client stream test failed")
-                time.sleep(5)  # Wait before next iteration
+                    logger.warning("[Client-%d] Client stream test failed", client_id)
+                await wait_for_stop(stop_event, 5)  # Wait before next iteration
 
             elif client_id == 2:
                 # Server Stream Test
-                success = client.test_server_stream(client_id)
+                success = await client.test_server_stream(client_id)
                 if not success:
-                    logger.warning(f"[Client-{client_id}] Server stream test failed")
-                time.sleep(4)  # Wait before next iteration
+                    logger.warning("[Client-%d] Server stream test failed", client_id)
+                await wait_for_stop(stop_event, 4)  # Wait before next iteration
 
             elif client_id == 3:
                 # Bidirectional Sync Test
-                success = client.test_bidirectional_stream_sync(client_id)
+                success = await client.test_bidirectional_stream_sync(client_id)
                 if not success:
                     logger.warning(
-                        f"[Client-{client_id}] Bidirectional sync test failed"
+                        "[Client-%d] Bidirectional sync test failed", client_id
                     )
-                time.sleep(6)  # Wait before next iteration
+                await wait_for_stop(stop_event, 6)  # Wait before next iteration
 
             elif client_id == 4:
                 # Bidirectional Async Test
-                success = client.test_bidirectional_stream_async(client_id)
+                success = await client.test_bidirectional_stream_async(client_id)
                 if not success:
                     logger.warning(
-                        f"[Client-{client_id}] Bidirectional async test failed"
+                        "[Client-%d] Bidirectional async test failed", client_id
                     )
-                time.sleep(7)  # Wait before next iteration
-
-            # Check stop event during sleep
-            if stop_event.wait(timeout=0.1):
-                break
+                await wait_for_stop(stop_event, 7)  # Wait before next iteration
 
     except Exception as e:
-        logger.error(f"[Client-{client_id}] Unexpected error: {e}")
+        logger.error("[Client-%d] Unexpected error: %s", client_id, e)
+    finally:
+        logger.info("[Client-%d] Client stopped", client_id)
+
+
+async def run_tests(args):
+    """
+    Run the tests selected on the command line.
+
+    Args:
+        args: Parsed command line arguments
+    """
+    # Setup signal handling
+    stop_event = asyncio.Event()
+
+    def signal_handler(signum):
+        logger.info("Received signal %s, initiating graceful shutdown...", signum)
+        stop_event.set()
+
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, signal_handler, signum)
+
+    # One pool of channels is shared by all clients
+    pool = ChannelPool(args.server, args.channels)
+
+    try:
+        if args.test == "all":
+            if args.once:
+                # For single run, create client and run each test once
+                for client_id in range(1, 5):
+                    client = EchoStreamClient(
+                        pool, args.pacing_ms, args.payload_size, args.payload_only
+                    )
+                    if client_id == 1:
+                        await client.test_client_stream(client_id)
+                    elif client_id == 2:
+                        await client.test_server_stream(client_id)
+                    elif client_id == 3:
+                        await client.test_bidirectional_stream_sync(client_id)
+                    elif client_id == 4:
+                        await client.test_bidirectional_stream_async(client_id)
+            else:
+                # For continuous run, run all clients concurrently until stopped
+                logger.info("All streaming clients started. Press Ctrl+C to stop...")
+                await asyncio.gather(
+                    *(
+                        run_client_tests(
+                            client_id,
+                            pool,
+                            stop_event,
+                            args.pacing_ms,
+                            args.payload_size,
+                            args.payload_only,
+                        )
+                        for client_id in range(1, 5)
+                    )
+                )
+            return
+
+        # Run specific test
+        client = EchoStreamClient(
+            pool, args.pacing_ms, args.payload_size, args.payload_only
+        )
+        client_id = 1
+
+        if args.test == "client":
+            while not stop_event.is_set():
+                await client.test_client_stream(client_id)
+                if args.once:
+                    break
+                await wait_for_stop(stop_event, 5)
+
+        elif args.test == "server":
+            while not stop_event.is_set():
+                await client.test_server_stream(client_id)
+                if args.once:
+                    break
+                await wait_for_stop(stop_event, 4)
+
+        elif args.test == "sync":
+            while not stop_event.is_set():
+                await client.test_bidirectional_stream_sync(client_id)
+                if args.once:
+                    break
+                await wait_for_stop(stop_event, 6)
+
+        elif args.test == "async":
+            while not stop_event.is_set():
+                await client.test_bidirectional_stream_async(client_id)
+                if args.once:
+                    break
+                await wait_for_stop(stop_event, 7)
+
     finally:
-        client.close()
-        logger.info(f"[Client-{client_id}] Client stopped")
+        await pool.close()
 
 
 def main():
@@ -395,6 +623,29 @@ def main():
         default="all",
         help="Which test to run (default: all)",
     )
+    parser.add_argument(
+        "--channels",
+        type=int,
+        default=4,
+        help="Number of channels shared by the test clients (default: 4)",
+    )
+    parser.add_argument(
+        "--pacing-ms",
+        type=int,
+        default=0,
+        help="Delay between sent messages in milliseconds (default: 0, no delay)",
+    )
+    parser.add_argument(
+        "--payload-size",
+        type=int,
+        default=0,
+        help="Size in bytes of the payload sent with every message (default: 0)",
+    )
+    parser.add_argument(
+        "--payload-only",
+        action="store_true",
+        help="Send only the payload, without the readable message text",
+    )
     parser.add_argument(
         "--verbose",
         action="store_true",
@@ -412,90 +663,8 @@ def main():
         logging.getLogger().setLevel(logging.DEBUG)
 
     logger.info("Starting gRPC Echo Stream Client...")
-
-    # Setup signal handling
-    stop_event = threading.Event()
-
-    def signal_handler(signum, frame):
-        logger.info(f"Received signal {signum}, initiating graceful shutdown...")
-        stop_event.set()
-
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
-
-    if args.test == "all":
-        # Run all tests in parallel threads
-        threads = []
-        for client_id in range(1, 5):
-            if args.once:
-                # For single run, create client and run test once
-                client = EchoStreamClient(args.server)
-                if client_id == 1:
-                    client.test_client_stream(client_id)
-                elif client_id == 2:
-                    client.test_server_stream(client_id)
-                elif client_id == 3:
-                    client.test_bidirectional_stream_sync(client_id)
-                elif client_id == 4:
-                    client.test_bidirectional_stream_async(client_id)
-                client.close()
-            else:
-                # For continuous run, start threads
-                thread = threading.Thread(
-                    target=run_client_tests,
-                    args=(client_id, args.server, stop_event),
-                    daemon=True,
-                )
-                thread.start()
-                threads.append(thread)
-
-        if not args.once:
-            logger.info("All streaming clients started. Press Ctrl+C to stop...")
-
-            # Wait for stop signal
-            stop_event.wait()
-
-            # Wait for all threads to finish
-            for thread in threads:
-                thread.join(timeout=5)
-
-    else:
-        # Run specific test
-        client = EchoStreamClient(args.server)
-        client_id = 1
-
-        try:
-            if args.test == "client":
-                while not stop_event.is_set():
-                    client.test_client_stream(client_id)
-                    if args.once:
-                        break
-                    time.sleep(5)
-
-            elif args.test == "server":
-                while not stop_event.is_set():
-                    client.test_server_stream(client_id)
-                    if args.once:
-                        break
-                    time.sleep(4)
-
-            elif args.test == "sync":
-                while not stop_event.is_set():
-                    client.test_bidirectional_stream_sync(client_id)
-                    if args.once:
-                        break
-                    time.sleep(6)
-
-            elif args.test == "async":
-                while not stop_event.is_set():
-                    client.test_bidirectional_stream_async(client_id)
-                    if args.once:
-                        break
-                    time.sleep(7)
-
-        finally:
-            client.close()
-
+    check_protobuf_backend()
+    asyncio.run(run_tests(args))
     logger.info("Client shutdown completed")
 
 
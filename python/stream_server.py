@@ -6,19 +6,18 @@ Implements all streaming patterns: client streaming, server streaming, and bidir
 
 import asyncio
 import logging
+import multiprocessing
+import os
 import signal
-import sys
-from concurrent import futures
-from typing import Iterator, Optional
+from typing import AsyncIterator
 import time
-import threading
-from queue import Queue, Empty
 
 import grpc
 
 # Import generated protobuf/grpc code
 from api.stream.v1 import stream_pb2
 from api.stream.v1 import stream_pb2_grpc
+from protobuf_backend import check_protobuf_backend
 
 
 # Configure logging
@@ -33,10 +32,19 @@ logger = logging.getLogger(__name__)
 class EchoStreamService(stream_pb2_grpc.EchoServiceServicer):
     """Implementation of the EchoService with all streaming patterns."""
 
-    def EchoClientStream(
+    def __init__(self, pacing_ms: int = 0):
+        """
+        Initialize the service.
+
+        Args:
+            pacing_ms: Delay between streamed messages in milliseconds, 0 for none
+        """
+        self.pacing = pacing_ms / 1000
+
+    async def EchoClientStream(
         self,
-        request_iterator: Iterator[stream_pb2.EchoRequest],
-        context: grpc.ServicerContext,
+        request_iterator: AsyncIterator[stream_pb2.EchoRequest],
+        context: grpc.aio.ServicerContext,
     ) -> stream_pb2.EchoResponse:
         """
         Client streaming RPC - receives multiple messages from client, returns one response.
@@ -50,29 +58,27 @@ class EchoStreamService(stream_pb2_grpc.EchoServiceServicer):
         """
         logger.info("EchoClientStream: Starting client stream")
 
-        messages = []
+        # Only the count is kept, so memory use does not grow with the stream
+        message_count = 0
         try:
-            for request in request_iterator:
-                logger.info(f"EchoClientStream: Received message: {request.message}")
-                messages.append(request.message)
-
-                # Check if client cancelled
-                if context.is_active() is False:
-                    logger.warning("EchoClientStream: Client cancelled the stream")
-                    break
+            # A cancelled stream cancels the handler task itself, so there is
+            # no need to poll the context between messages
+            async for request in request_iterator:
+                logger.debug("EchoClientStream: Received message: %s", request.message)
+                message_count += 1
 
         except grpc.RpcError as e:
-            logger.error(f"EchoClientStream: Error receiving message: {e}")
-            context.abort(grpc.StatusCode.INTERNAL, str(e))
+            logger.error("EchoClientStream: Error receiving message: %s", e)
+            await context.abort(grpc.StatusCode.INTERNAL, str(e))
 
-        response_message = f"Received {len(messages)} messages: {messages}"
-        logger.info(f"EchoClientStream: Sending response: {response_message}")
+        response_message = f"Received {message_count} messages"
+        logger.info("EchoClientStream: Sending response: %s", response_message)
 
         return stream_pb2.EchoResponse(message=response_message)
 
-    def EchoServerStream(
-        self, request: stream_pb2.EchoRequest, context: grpc.ServicerContext
-    ) -> Iterator[stream_pb2.EchoResponse]:
+    async def EchoServerStream(
+        self, request: stream_pb2.EchoRequest, context: grpc.aio.ServicerContext
+    ) -> AsyncIterator[stream_pb2.EchoResponse]:
         """
         Server streaming RPC - receives one message and sends back a stream of responses.
 
@@ -83,29 +89,35 @@ class EchoStreamService(stream_pb2_grpc.EchoServiceServicer):
         Yields:
             Multiple EchoResponse messages
         """
-        logger.info(f"EchoServerStream: Received message: {request.message}")
+        # Protobuf field access is slower than a local lookup, so the request
+        # message is read once for the whole stream
+        message = request.message
+        logger.info("EchoServerStream: Received message: %s", message)
 
-        for i in range(1, 6):
-            # Check if client is still connected
-            if not context.is_active():
-                logger.warning("EchoServerStream: Client disconnected")
-                break
+        # One response object is reused for the whole stream: grpc serializes
+        # each yielded response before resuming the generator
+        response = stream_pb2.EchoResponse(payload=request.payload)
 
-            response_message = f"Echo #{i}: {request.message}"
-            logger.info(f"EchoServerStream: Sending response #{i}: {response_message}")
+        for i in range(1, 6):
+            response_message = f"Echo #{i}: {message}"
+            response.message = response_message
+            logger.debug(
+                "EchoServerStream: Sending response #%d: %s", i, response_message
+            )
 
-            yield stream_pb2.EchoResponse(message=response_message)
+            yield response
 
-            # Small delay between messages
-            time.sleep(0.1)
+            # Optional delay between messages
+            if self.pacing:
+                await asyncio.sleep(self.pacing)
 
         logger.info("EchoServerStream: Finished sending responses")
 
-    def EchoBidirectionalStreamSync(
+    async def EchoBidirectionalStreamSync(
         self,
-        request_iterator: Iterator[stream_pb2.EchoRequest],
-        context: grpc.ServicerContext,
-    ) -> Iterator[stream_pb2.EchoResponse]:
+        request_iterator: AsyncIterator[stream_pb2.EchoRequest],
+        context: grpc.aio.ServicerContext,
+    ) -> AsyncIterator[stream_pb2.EchoResponse]:
         """
         Bidirectional streaming RPC with synchronous processing.
         Processes each request immediately and sends a response.
@@ -119,39 +131,46 @@ class EchoStreamService(stream_pb2_grpc.EchoServiceServicer):
         """
         logger.info("EchoBidirectionalStreamSync: Starting bidirectional stream (sync)")
 
+        # One response object is reused for the whole stream: grpc serializes
+        # each yielded response before resuming the generator
+        response = stream_pb2.EchoResponse()
+        response_count = 0
         try:
-            for request in request_iterator:
-                # Check if client is still connected
-                if not context.is_active():
-                    logger.warning("EchoBidirectionalStreamSync: Client disconnected")
-                    break
-
-                logger.info(
-                    f"EchoBidirectionalStreamSync: Received message: {request.message}"
+            async for request in request_iterator:
+                # Read the field once for both the log and the response
+                message = request.message
+                logger.debug(
+                    "EchoBidirectionalStreamSync: Received message: %s", message
                 )
 
                 # Process and respond immediately (synchronous)
-                response_message = f"Sync Echo: {request.message}"
-                logger.info(
-                    f"EchoBidirectionalStreamSync: Sent response: {response_message}"
+                response_message = f"Sync Echo: {message}"
+                response.message = response_message
+                response.payload = request.payload
+                logger.debug(
+                    "EchoBidirectionalStreamSync: Sent response: %s", response_message
                 )
 
-                yield stream_pb2.EchoResponse(message=response_message)
+                yield response
+                response_count += 1
 
         except grpc.RpcError as e:
-            logger.error(f"EchoBidirectionalStreamSync: Error in stream: {e}")
-            context.abort(grpc.StatusCode.INTERNAL, str(e))
+            logger.error("EchoBidirectionalStreamSync: Error in stream: %s", e)
+            await context.abort(grpc.StatusCode.INTERNAL, str(e))
 
-        logger.info("EchoBidirectionalStreamSync: Stream finished")
+        logger.info(
+            "EchoBidirectionalStreamSync: Stream finished, sent %d responses",
+            response_count,
+        )
 
-    def EchoBidirectionalStreamAsync(
+    async def EchoBidirectionalStreamAsync(
         self,
-        request_iterator: Iterator[stream_pb2.EchoRequest],
-        context: grpc.ServicerContext,
-    ) -> Iterator[stream_pb2.EchoResponse]:
+        request_iterator: AsyncIterator[stream_pb2.EchoRequest],
+        context: grpc.aio.ServicerContext,
+    ) -> AsyncIterator[stream_pb2.EchoResponse]:
         """
         Bidirectional streaming RPC with asynchronous processing.
-        Uses separate threads for receiving and processing messages.
+        Receives and processes messages in a separate task.
 
         Args:
             request_iterator: Iterator of client requests
@@ -164,167 +183,192 @@ class EchoStreamService(stream_pb2_grpc.EchoServiceServicer):
             "EchoBidirectionalStreamAsync: Starting bidirectional stream (async)"
         )
 
-        # Queue for passing messages between receiver and processor threads
-        request_queue = Queue(maxsize=10)
-        response_queue = Queue(maxsize=10)
-        stop_event = threading.Event()
+        # HTTP/2 flow control already buffers the requests, so the processor
+        # reads them straight from the stream. Responses are handed over one
+        # at a time, which blocks the processor as soon as the client stops
+        # reading
+        response_queue = asyncio.Queue(maxsize=1)
 
-        def receive_messages():
-            """Thread function for receiving messages from client."""
+        async def process_messages():
+            """Task receiving and processing messages asynchronously."""
             try:
-                for request in request_iterator:
-                    if stop_event.is_set() or not context.is_active():
-                        break
-
-                    logger.info(
-                        f"EchoBidirectionalStreamAsync: Received message: {request.message}"
+                async for request in request_iterator:
+                    message = request.message
+                    logger.debug(
+                        "EchoBidirectionalStreamAsync: Received message: %s", message
                     )
-                    request_queue.put(request)
 
-            except Exception as e:
-                logger.error(f"EchoBidirectionalStreamAsync: Error receiving: {e}")
-            finally:
-                # Signal end of stream
-                request_queue.put(None)
-                stop_event.set()
-
-        def process_messages():
-            """Thread function for processing messages asynchronously."""
-            try:
-                while not stop_event.is_set():
-                    try:
-                        # Get request with timeout to check stop event periodically
-                        request = request_queue.get(timeout=0.1)
+                    # Optionally simulate async processing with delay
+                    if self.pacing:
+                        await asyncio.sleep(self.pacing)
 
-                        if request is None:  # End of stream signal
-                            break
-
-                        # Simulate async processing with delay
-                        time.sleep(0.2)
-
-                        response_message = f"Async Echo (processed): {request.message}"
-                        response = stream_pb2.EchoResponse(message=response_message)
-
-                        response_queue.put(response)
-                        logger.info(
-                            f"EchoBidirectionalStreamAsync: Processed async response: {response_message}"
-                        )
+                    response_message = f"Async Echo (processed): {message}"
+                    response = stream_pb2.EchoResponse(
+                        message=response_message, payload=request.payload
+                    )
 
-                    except Empty:
-                        continue
-                    except Exception as e:
-                        logger.error(
-                            f"EchoBidirectionalStreamAsync: Error processing: {e}"
-                        )
+                    await response_queue.put(response)
+                    logger.debug(
+                        "EchoBidirectionalStreamAsync: Processed async response: %s",
+                        response_message,
+                    )
 
-            finally:
-                # Signal end of processing
-                response_queue.put(None)
+            except Exception as e:
+                logger.error("EchoBidirectionalStreamAsync: Error processing: %s", e)
 
-        # Start receiver and processor threads
-        receiver_thread = threading.Thread(target=receive_messages, daemon=True)
-        processor_thread = threading.Thread(target=process_messages, daemon=True)
+            # Signal end of processing
+            await response_queue.put(None)
 
-        receiver_thread.start()
-        processor_thread.start()
+        processor_task = asyncio.create_task(process_messages())
 
         # Yield responses as they become available
+        response_count = 0
         try:
             while True:
-                if not context.is_active():
-                    stop_event.set()
-                    break
+                response = await response_queue.get()
 
-                try:
-                    response = response_queue.get(timeout=0.1)
-
-                    if response is None:  # End of processing signal
-                        break
-
-                    logger.info(
-                        f"EchoBidirectionalStreamAsync: Sent async response: {response.message}"
-                    )
-                    yield response
+                if response is None:  # End of processing signal
+                    break
 
-                except Empty:
-                    continue
+                logger.debug(
+                    "EchoBidirectionalStreamAsync: Sent async response: %s",
+                    response.message,
+                )
+                yield response
+                response_count += 1
 
         except Exception as e:
-            logger.error(f"EchoBidirectionalStreamAsync: Error sending responses: {e}")
+            logger.error("EchoBidirectionalStreamAsync: Error sending responses: %s", e)
         finally:
-            stop_event.set()
-
-        # Wait for threads to finish
-        receiver_thread.join(timeout=1.0)
-        processor_thread.join(timeout=1.0)
+            # Stop the processor if the client went away before the end of stream
+            processor_task.cancel()
 
-        logger.info("EchoBidirectionalStreamAsync: Stream finished")
+        logger.info(
+            "EchoBidirectionalStreamAsync: Stream finished, sent %d responses",
+            response_count,
+        )
 
 
-class StreamServerInterceptor(grpc.ServerInterceptor):
+class StreamServerInterceptor(grpc.aio.ServerInterceptor):
     """Server interceptor for logging and monitoring."""
 
-    def intercept_service(self, continuation, handler_call_details):
-        """Intercept and log service calls."""
-        start_time = time.time()
-
-        logger.info(f"[INTERCEPTOR] Starting call to {handler_call_details.method}")
-
-        # Call the actual handler
-        response = continuation(handler_call_details)
-
-        duration = time.time() - start_time
-        logger.info(
-            f"[INTERCEPTOR] {handler_call_details.method} setup completed in {duration:.3f}s"
+    async def intercept_service(self, continuation, handler_call_details):
+        """Wrap the service handler to log the duration of each call."""
+        handler = await continuation(handler_call_details)
+        if handler is None:
+            return handler
+
+        # continuation only looks the handler up, the call itself runs later,
+        # so the timer has to live inside a wrapper around the handler
+        method = handler_call_details.method
+
+        def log_duration(start_time: int):
+            logger.debug(
+                "[INTERCEPTOR] %s completed in %d us",
+                method,
+                (time.monotonic_ns() - start_time) // 1000,
+            )
+
+        if handler.response_streaming:
+            if handler.request_streaming:
+                behavior = handler.stream_stream
+                handler_factory = grpc.stream_stream_rpc_method_handler
+            else:
+                behavior = handler.unary_stream
+                handler_factory = grpc.unary_stream_rpc_method_handler
+
+            async def wrapped(request, context):
+                start_time = time.monotonic_ns()
+                try:
+                    async for response in behavior(request, context):
+                        yield response
+                finally:
+                    log_duration(start_time)
+
+        else:
+            if handler.request_streaming:
+                behavior = handler.stream_unary
+                handler_factory = grpc.stream_unary_rpc_method_handler
+            else:
+                behavior = handler.unary_unary
+                handler_factory = grpc.unary_unary_rpc_method_handler
+
+            async def wrapped(request, context):
+                start_time = time.monotonic_ns()
+                try:
+                    return await behavior(request, context)
+                finally:
+                    log_duration(start_time)
+
+        return handler_factory(
+            wrapped,
+            request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer,
         )
 
-        return response
-
 
-def serve(port: int = 8080, max_workers: int = 10):
+async def serve(port: int = 8080, pacing_ms: int = 0):
     """
     Start the gRPC server.
 
     Args:
         port: Port to listen on
-        max_workers: Maximum number of worker threads
+        pacing_ms: Delay between streamed messages in milliseconds, 0 for none
     """
-    # Create server with thread pool
-    server = grpc.server(
-        futures.ThreadPoolExecutor(max_workers=max_workers),
-        interceptors=[StreamServerInterceptor()],
+    # All streams are served by coroutines on a single event loop. The
+    # interceptor only logs at DEBUG, so it is skipped unless that is enabled
+    server = grpc.aio.server(
+        interceptors=(
+            [StreamServerInterceptor()] if logger.isEnabledFor(logging.DEBUG) else None
+        ),
         options=[
             ("grpc.max_send_message_length", 50 * 1024 * 1024),  # 50MB
             ("grpc.max_receive_message_length", 50 * 1024 * 1024),  # 50MB
+            # Let several server processes listen on the same port
+            ("grpc.so_reuseport", 1),
         ],
     )
 
     # Add service to server
-    stream_pb2_grpc.add_EchoServiceServicer_to_server(EchoStreamService(), server)
+    stream_pb2_grpc.add_EchoServiceServicer_to_server(
+        EchoStreamService(pacing_ms), server
+    )
 
     # Add insecure port
     server_address = f"[::]:{port}"
     server.add_insecure_port(server_address)
 
     # Start server
-    server.start()
+    await server.start()
     logger.info(f"gRPC Echo Stream Server listening on {server_address}")
 
     # Setup signal handlers for graceful shutdown
-    def signal_handler(signum, frame):
+    stop_event = asyncio.Event()
+
+    def signal_handler(signum):
         logger.info(f"Received signal {signum}, initiating graceful shutdown...")
-        server.stop(grace=5.0)
-        sys.exit(0)
+        stop_event.set()
+
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, signal_handler, signum)
+
+    # Keep server running
+    await stop_event.wait()
+    await server.stop(grace=5.0)
 
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
 
-    try:
-        # Keep server running
-        server.wait_for_termination()
-    except KeyboardInterrupt:
-        logger.info("Server interrupted by user")
-        server.stop(grace=5.0)
+def run_server(port: int, pacing_ms: int, log_level: int):
+    """
+    Run a server process until it is signalled to stop.
+
+    Args:
+        port: Port to listen on
+        pacing_ms: Delay between streamed messages in milliseconds, 0 for none
+        log_level: Root logging level of the process
+    """
+    logging.getLogger().setLevel(log_level)
+    asyncio.run(serve(port=port, pacing_ms=pacing_ms))
 
 
 def main():
@@ -336,20 +380,52 @@ def main():
         "--port", type=int, default=8080, help="Port to listen on (default: 8080)"
     )
     parser.add_argument(
-        "--workers",
+        "--pacing-ms",
+        type=int,
+        default=0,
+        help="Delay between streamed messages in milliseconds (default: 0, no delay)",
+    )
+    parser.add_argument(
+        "--procs",
         type=int,
-        default=10,
-        help="Maximum number of worker threads (default: 10)",
+        default=1,
+        help="Number of server processes sharing the port (default: 1)",
     )
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
 
     args = parser.parse_args()
 
-    if args.verbose:
-        logging.getLogger().setLevel(logging.DEBUG)
+    log_level = logging.DEBUG if args.verbose else logging.INFO
 
     logger.info("Starting gRPC Echo Stream Server...")
-    serve(port=args.port, max_workers=args.workers)
+    check_protobuf_backend()
+    if args.procs == 1:
+        run_server(args.port, args.pacing_ms, log_level)
+        return
+
+    # Each process has its own event loop and GIL and the kernel balances
+    # connections between them. The processes are started before the parent
+    # creates any gRPC objects so they do not inherit its gRPC state
+    workers = [
+        multiprocessing.Process(
+            target=run_server, args=(args.port, args.pacing_ms, log_level)
+        )
+        for _ in range(args.procs)
+    ]
+    for worker in workers:
+        worker.start()
+
+    def signal_handler(signum, frame):
+        # Pass the signal on so every server shuts down gracefully
+        for worker in workers:
+            if worker.is_alive():
+                os.kill(worker.pid, signum)
+
+    signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGTERM, signal_handler)
+
+    for worker in workers:
+        worker.join()
 
 
 if __name__ == "__main__":